@@ -15,12 +15,9 @@ ball_radius = 0.05
 min_val, max_val = -1.0, 1.0
 dt = 0.1
 
-x = (max_val - min_val) * (np.random.rand() - 0.5)
-y = (max_val - min_val) * (np.random.rand() - 0.5)
-z = (max_val - min_val) * (np.random.rand() - 0.5)
-vx = (max_val - min_val) * (np.random.rand() - 0.5)
-vy = (max_val - min_val) * (np.random.rand() - 0.5)
-vz = (max_val - min_val) * (np.random.rand() - 0.5)
+seed = st.sidebar.number_input("Random seed (-1 for a fresh one)", value=-1, step=1)
+rng = np.random.default_rng(None if seed < 0 else int(seed))
+x, y, z, vx, vy, vz = (max_val - min_val) * (rng.random(6) - 0.5)
 
 # ****************************************
 # 3D Scene Setup
@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+from PeriodDoubling import PeriodDoubling
 
 # ****************************************
 # Page Configuration and Title
@@ -18,6 +19,7 @@ dr = st.sidebar.number_input("dr", value=0.005, format="%.4f")
 ntransient = st.sidebar.number_input("ntransient", value=200)
 nplot = st.sidebar.number_input("nplot", value=50)
 r_max = st.sidebar.number_input("Max r", value=1.0)
+n_doublings = st.sidebar.number_input("Period doublings to locate", value=12, step=1)
 
 # ****************************************
 # Logistic Map Function
@@ -48,3 +50,19 @@ if st.sidebar.button("Generate Diagram"):
     ax.set_xlabel("r")
     ax.set_ylabel("x")
     st.pyplot(fig)
+
+
+if st.sidebar.button("Locate Period Doublings"):
+    cascade = PeriodDoubling()
+    r_n = cascade.find(int(n_doublings))
+    delta = cascade.delta_estimates()
+
+    st.subheader("Period-Doubling Cascade")
+    st.dataframe({
+        'n': range(1, len(r_n) + 1),
+        'Period born': [2 ** n for n in range(1, len(r_n) + 1)],
+        'r_n': r_n,
+        'delta_n': np.concatenate([[np.nan], delta, [np.nan]])[:len(r_n)],
+    })
+    if len(delta):
+        st.write(f"Feigenbaum constant estimate: delta = {delta[-1]:.6f}")
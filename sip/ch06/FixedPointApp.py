@@ -1,5 +1,6 @@
 import streamlit as st
 import numpy as np
+from PeriodicOrbits import find_periodic_points, minimal_period
 
 # ****************************************
 # Page Configuration and Title
@@ -58,3 +59,17 @@ if st.sidebar.button("Find Fixed Point"):
             trajectory.append(x)
         
         st.dataframe({'Step': range(len(trajectory)), 'x': trajectory})
+
+
+if st.sidebar.button("Find All Periodic Points"):
+    points, multipliers = find_periodic_points(r, int(period), tol=epsilon)
+    found = ~np.isnan(points[0])
+    x_all, lam = points[0][found], multipliers[0][found]
+
+    st.subheader(f"All {len(x_all)} solutions of f^{period}(x) = x")
+    st.dataframe({
+        'x': x_all,
+        'Multiplier': lam,
+        'Minimal period': minimal_period(x_all, r, int(period)),
+        'Stable': np.abs(lam) < 1,
+    })
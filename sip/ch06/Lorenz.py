@@ -71,6 +71,98 @@ class Lorenz:
         dz_dt = x * y - self.b * z
         return [dx_dt, dy_dt, dz_dt]
 
+    # ****************************************
+    # Parameter Sweep
+    # ****************************************
+    def sweep(self, rho_values, t_max=200.0, transient=50.0, dt=None, initial=(1.0, 1.0, 20.0)):
+        """
+        Integrates one trajectory per rho value as a single vectorized RK4 ensemble and
+        records only the local maxima of z, refined by cubic Hermite interpolation.
+
+        The parameters b and c are taken from this instance; rho plays the role of a.
+
+        :param rho_values: Array of rho values.
+        :param t_max: Total integration time.
+        :param transient: Time discarded before maxima are recorded.
+        :param dt: Fixed RK4 time step, defaults to self.dt.
+        :param initial: Initial (x, y, z) shared by all trajectories.
+        :return: Tuple (rho_index, z_max) of flat arrays, in time order per rho.
+        """
+        rho = np.asarray(rho_values, dtype=float)
+        dt = self.dt if dt is None else dt
+        b, c = self.b, self.c
+        state = np.empty((3, len(rho)))
+        state[:] = np.asarray(initial, dtype=float)[:, None]
+
+        def rate(s):
+            x, y, z = s
+            return np.array([-c * (x - y), -y - x * z + rho * x, x * y - b * z])
+
+        index_blocks, zmax_blocks = [], []
+        z_rate = state[0] * state[1] - b * state[2]
+        for n in range(int(round(t_max / dt))):
+            k1 = rate(state)
+            k2 = rate(state + 0.5 * dt * k1)
+            k3 = rate(state + 0.5 * dt * k2)
+            k4 = rate(state + dt * k3)
+            z_old = state[2].copy()
+            state += dt / 6.0 * (k1 + 2 * k2 + 2 * k3 + k4)
+            z_rate_new = state[0] * state[1] - b * state[2]
+
+            if (n + 1) * dt > transient:
+                peak = np.nonzero((z_rate > 0) & (z_rate_new <= 0))[0]
+                if len(peak):
+                    index_blocks.append(peak)
+                    zmax_blocks.append(self._hermite_max(
+                        z_old[peak], state[2, peak], z_rate[peak], z_rate_new[peak], dt))
+            z_rate = z_rate_new
+
+        if not index_blocks:
+            return np.array([], dtype=int), np.array([])
+        rho_index = np.concatenate(index_blocks)
+        z_max = np.concatenate(zmax_blocks)
+        order = np.argsort(rho_index, kind='stable')
+        return rho_index[order], z_max[order]
+
+    @staticmethod
+    def _hermite_max(z0, z1, dz0, dz1, dt):
+        """
+        Maximum of the cubic Hermite interpolant on [0, dt] whose derivative
+        changes sign from dz0 > 0 to dz1 <= 0.
+        """
+        # derivative of the Hermite cubic in s = t/dt is the quadratic p(s) = A s^2 + B s + C
+        m0, m1 = dz0 * dt, dz1 * dt
+        A = 6 * (z0 - z1) + 3 * (m0 + m1)
+        B = -6 * (z0 - z1) - 4 * m0 - 2 * m1
+        C = m0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            disc = np.sqrt(np.maximum(B * B - 4 * A * C, 0.0))
+            q = -0.5 * (B + np.copysign(disc, B))
+            roots = np.stack([q / A, C / q])
+        roots = np.where((roots >= 0) & (roots <= 1), roots, np.nan)
+        s = np.nanmin(np.where(np.isnan(roots), np.inf, roots), axis=0)
+        s = np.where(np.isfinite(s), s, -C / np.where(B != 0, B, 1.0))
+        s = np.clip(s, 0.0, 1.0)
+        h00 = 2 * s**3 - 3 * s**2 + 1
+        h10 = s**3 - 2 * s**2 + s
+        h01 = -2 * s**3 + 3 * s**2
+        h11 = s**3 - s**2
+        return h00 * z0 + h10 * m0 + h01 * z1 + h11 * m1
+
+    @staticmethod
+    def return_maps(rho_index, z_max, n_rho):
+        """
+        Splits sweep output into per-rho return maps (z_max[k], z_max[k + 1]).
+
+        :return: List of arrays of shape (m, 2), one per rho value.
+        """
+        bounds = np.searchsorted(rho_index, np.arange(n_rho + 1))
+        maps = []
+        for i in range(n_rho):
+            z = z_max[bounds[i]:bounds[i + 1]]
+            maps.append(np.column_stack([z[:-1], z[1:]]))
+        return maps
+
     # ****************************************
     # Plotting
     # ****************************************
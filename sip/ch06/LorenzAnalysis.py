@@ -0,0 +1,160 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from scipy.spatial import cKDTree
+
+# ****************************************
+# Trajectory Cache
+# ****************************************
+_cache = OrderedDict()
+_CACHE_SIZE = 64
+
+def _cached(key, compute):
+    """
+    Returns the cached result for key, calling compute() on a miss; the least
+    recently used entry is evicted once the cache holds _CACHE_SIZE results.
+    """
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+    _cache[key] = compute()
+    if len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    return _cache[key]
+
+def trajectory_hash(points):
+    """
+    Returns a hash identifying a trajectory by its sampled points.
+
+    :param points: Array of shape (n, 3) with the trajectory points.
+    :return: Hex digest of the point data.
+    """
+    points = np.ascontiguousarray(points, dtype=float)
+    digest = hashlib.sha1(points.tobytes())
+    digest.update(str(points.shape).encode())
+    return digest.hexdigest()
+
+# ****************************************
+# LorenzAnalysis Class
+# ****************************************
+class LorenzAnalysis:
+    """
+    Attractor invariants (correlation sum, correlation dimension and recurrence rate)
+    for a Lorenz trajectory, computed with a KD-tree over the trail.
+    """
+    def __init__(self, trail, n_sample=None, transient=0, seed=None):
+        """
+        Builds the KD-tree over the trajectory.
+
+        :param trail: Sequence of [x, y, z] points, e.g. Lorenz.trail.
+        :param n_sample: Optional number of points kept by random subsampling.
+        :param transient: Number of leading points discarded as transient.
+        :param seed: Seed used for subsampling.
+        """
+        points = np.asarray(trail, dtype=float)[transient:]
+        if n_sample is not None and n_sample < len(points):
+            rng = np.random.default_rng(seed)
+            points = points[np.sort(rng.choice(len(points), n_sample, replace=False))]
+        self.points = points
+        self.key = trajectory_hash(points)
+        self.tree = cKDTree(points)
+
+    # ****************************************
+    # Correlation Sum and Dimension
+    # ****************************************
+    def radii(self, r_min=None, r_max=None, n_radii=30):
+        """
+        Returns a log-spaced radius set spanning the attractor.
+
+        :param r_min: Smallest radius, defaults to 1e-3 of the attractor extent.
+        :param r_max: Largest radius, defaults to half the attractor extent.
+        :param n_radii: Number of radii.
+        """
+        extent = np.max(np.ptp(self.points, axis=0))
+        r_min = 1e-3 * extent if r_min is None else r_min
+        r_max = 0.5 * extent if r_max is None else r_max
+        return np.logspace(np.log10(r_min), np.log10(r_max), n_radii)
+
+    def correlation_sum(self, radii):
+        """
+        Grassberger-Procaccia correlation sum C(r), the fraction of distinct point
+        pairs closer than r.
+
+        :param radii: Increasing array of radii.
+        :return: Array of C(r) values, all zero with fewer than two points.
+        """
+        radii = np.asarray(radii, dtype=float)
+        n = len(self.points)
+        if n < 2:
+            return np.zeros(len(radii))
+
+        def compute():
+            # count_neighbors counts ordered pairs including self-pairs
+            counts = self.tree.count_neighbors(self.tree, radii)
+            return (counts - n) / (n * (n - 1.0))
+        return _cached((self.key, "C", radii.tobytes()), compute)
+
+    def correlation_dimension(self, radii, fit_range=None):
+        """
+        Estimates the correlation dimension from the slope of log C(r) vs log r.
+
+        :param radii: Increasing array of radii.
+        :param fit_range: Optional (r_lo, r_hi) interval for the fit.
+        :return: Tuple (dimension, local slopes).
+        """
+        radii = np.asarray(radii, dtype=float)
+        c = self.correlation_sum(radii)
+        valid = c > 0
+        if fit_range is not None:
+            valid &= (radii >= fit_range[0]) & (radii <= fit_range[1])
+        log_r, log_c = np.log(radii[valid]), np.log(c[valid])
+        slopes = np.gradient(log_c, log_r) if len(log_r) > 1 else np.array([])
+        dimension = np.polyfit(log_r, log_c, 1)[0] if len(log_r) > 1 else np.nan
+        return dimension, slopes
+
+    # ****************************************
+    # Recurrence Statistics
+    # ****************************************
+    def recurrence_rate(self, eps, min_separation=0):
+        """
+        Recurrence rate, the fraction of point pairs closer than eps, excluding pairs
+        closer than min_separation in time.
+
+        :param eps: Recurrence threshold.
+        :param min_separation: Theiler window in samples.
+        :return: Recurrence rate.
+        """
+        def compute():
+            n = len(self.points)
+            pairs = self.tree.query_pairs(eps, output_type='ndarray')
+            if min_separation > 0:
+                pairs = pairs[np.abs(pairs[:, 1] - pairs[:, 0]) >= min_separation]
+            n_pairs = n * (n - 1) / 2.0
+            if min_separation > 0:
+                m = min(min_separation, n)
+                n_pairs -= (m - 1) * n - m * (m - 1) / 2.0
+            return len(pairs) / n_pairs if n_pairs > 0 else 0.0
+        return _cached((self.key, "RR", float(eps), int(min_separation)), compute)
+
+    def recurrence_times(self, eps, min_separation=1):
+        """
+        Returns the first-return times (in samples) into an eps-ball for every point.
+
+        :param eps: Recurrence threshold.
+        :param min_separation: Minimum index separation counted as a return.
+        :return: Array of return times, one per point that returns.
+        """
+        def compute():
+            pairs = self.tree.query_pairs(eps, output_type='ndarray')
+            lag = pairs[:, 1] - pairs[:, 0]
+            keep = lag >= min_separation
+            first = np.full(len(self.points), np.iinfo(np.int64).max)
+            np.minimum.at(first, pairs[keep, 0], lag[keep])
+            return first[first < np.iinfo(np.int64).max]
+        return _cached((self.key, "RT", float(eps), int(min_separation)), compute)
+
+def clear_cache():
+    """
+    Clears all cached analysis results.
+    """
+    _cache.clear()
@@ -3,6 +3,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import time
+from Lorenz import Lorenz
 
 # ****************************************
 # Page Configuration and Title
@@ -62,6 +63,36 @@ def update_plot():
     line.set_3d_properties(st.session_state.z_history)
     plot_placeholder.pyplot(fig)
 
+# ****************************************
+# Rho Sweep
+# ****************************************
+st.sidebar.header("Rho Sweep")
+rho_min = st.sidebar.number_input("Min rho", value=20.0)
+rho_max = st.sidebar.number_input("Max rho", value=200.0)
+n_rho = st.sidebar.number_input("Number of rho values", value=500, step=50)
+sweep_time = st.sidebar.number_input("Sweep time", value=100.0)
+sweep_transient = st.sidebar.number_input("Sweep transient", value=30.0)
+
+if st.sidebar.button("Run Sweep"):
+    rho_values = np.linspace(rho_min, rho_max, int(n_rho))
+    model = Lorenz(b=beta, c=sigma, dt=min(dt, 0.005))
+    rho_index, z_max = model.sweep(rho_values, t_max=sweep_time, transient=sweep_transient)
+
+    st.subheader("Bifurcation Diagram of z Maxima")
+    fig_sweep, (ax_bif, ax_map) = plt.subplots(1, 2, figsize=(14, 6))
+    ax_bif.plot(rho_values[rho_index], z_max, ',k', alpha=0.5)
+    ax_bif.set_xlabel("rho")
+    ax_bif.set_ylabel("z max")
+
+    maps = Lorenz.return_maps(rho_index, z_max, len(rho_values))
+    i_rho = int(np.argmin(np.abs(rho_values - rho)))
+    ax_map.plot(maps[i_rho][:, 0], maps[i_rho][:, 1], '.', ms=2)
+    ax_map.set_xlabel("z max (n)")
+    ax_map.set_ylabel("z max (n+1)")
+    ax_map.set_title(f"Return map at rho = {rho_values[i_rho]:.2f}")
+    st.pyplot(fig_sweep)
+    plt.close(fig_sweep)
+
 # ****************************************
 # Simulation Loop
 # ****************************************
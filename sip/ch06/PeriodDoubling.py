@@ -0,0 +1,154 @@
+import numpy as np
+
+# ****************************************
+# Derivatives of the Iterated Logistic Map
+# ****************************************
+def orbit_jacobian(x, r, period):
+    """
+    Iterates f(x) = 4 r x (1 - x) period times, propagating by the chain rule the
+    derivatives needed for a joint Newton solve on (x, r).
+
+    :param x: Starting point.
+    :param r: Map parameter.
+    :param period: Number of iterations.
+    :return: Tuple (y, y_x, y_r, y_xx, y_xr) for y = f^period(x).
+    """
+    y, y_x, y_r, y_xx, y_xr = x, 1.0, 0.0, 0.0, 0.0
+    for _ in range(period):
+        g_y = 4 * r * (1 - 2 * y)
+        g_r = 4 * y * (1 - y)
+        g_yr = 4 * (1 - 2 * y)
+        y_xx = y_xx * g_y - 8 * r * y_x * y_x
+        y_xr = y_xr * g_y + y_x * (g_yr - 8 * r * y_r)
+        y_x, y_r = y_x * g_y, y_r * g_y + g_r
+        y = 4 * r * y * (1 - y)
+    return y, y_x, y_r, y_xx, y_xr
+
+def solve_orbit(x, r, period, tol=1e-12, max_iter=50):
+    """
+    Newton solve of f^period(x) = x in x at fixed r.
+
+    :return: The periodic point, or NaN if Newton fails.
+    """
+    for _ in range(max_iter):
+        y, y_x = orbit_jacobian(x, r, period)[:2]
+        dx = (y - x) / (y_x - 1)
+        x -= dx
+        if not 0.0 <= x <= 1.0:
+            return np.nan
+        if abs(dx) < tol:
+            return x
+    return np.nan
+
+def solve_doubling(x, r, period, tol=1e-12, max_iter=50):
+    """
+    Joint Newton solve on (x, r) of f^period(x) = x and (f^period)'(x) = -1.
+
+    :return: Tuple (x, r), or (NaN, NaN) if Newton fails.
+    """
+    for _ in range(max_iter):
+        y, y_x, y_r, y_xx, y_xr = orbit_jacobian(x, r, period)
+        residual = np.array([y - x, y_x + 1])
+        jacobian = np.array([[y_x - 1, y_r], [y_xx, y_xr]])
+        try:
+            dx, dr = np.linalg.solve(jacobian, residual)
+        except np.linalg.LinAlgError:
+            return np.nan, np.nan
+        x, r = x - dx, r - dr
+        if not (0.0 <= x <= 1.0 and 0.0 < r <= 1.0):
+            return np.nan, np.nan
+        if abs(dx) < tol and abs(dr) < tol:
+            return x, r
+    return np.nan, np.nan
+
+# ****************************************
+# PeriodDoubling Class
+# ****************************************
+class PeriodDoubling:
+    """
+    Continuation engine locating the period-doubling cascade r_1 < r_2 < ... of the
+    logistic map and estimating the Feigenbaum constant delta.
+    """
+    def __init__(self, delta_guess=4.669, n_track=20):
+        """
+        :param delta_guess: Feigenbaum constant used to extrapolate the first guesses.
+        :param n_track: Number of continuation steps used to follow each new orbit.
+        """
+        self.delta_guess = delta_guess
+        self.n_track = n_track
+        self.r_values = []
+        self.x_values = []
+
+    # ****************************************
+    # Continuation
+    # ****************************************
+    def track(self, x, r0, r1, period):
+        """
+        Follows a period-p point from r0 to r1 with natural-parameter continuation.
+
+        :return: The periodic point at r1, or NaN if the branch is lost.
+        """
+        for r in np.linspace(r0, r1, self.n_track + 1)[1:]:
+            x = solve_orbit(x, r, period)
+            if np.isnan(x):
+                break
+        return x
+
+    def superstable(self, r, period, tol=1e-12, max_iter=50):
+        """
+        Newton solve in r of f^period(1/2) = 1/2, the superstable parameter of the
+        period-p orbit, which lies between its birth and its own doubling.
+
+        :return: The superstable r, or NaN if Newton fails.
+        """
+        for _ in range(max_iter):
+            y, _, y_r = orbit_jacobian(0.5, r, period)[:3]
+            dr = (y - 0.5) / y_r
+            r -= dr
+            if not 0.0 < r <= 1.0:
+                return np.nan
+            if abs(dr) < tol:
+                return r
+        return np.nan
+
+    def find(self, n_max=12):
+        """
+        Locates the first n_max period-doubling points.
+
+        The fixed point x* = 1 - 1/(4r) doubles at r_1 = 3/4. For every later r_n
+        the newborn orbit of period 2^(n-1) is picked up at its superstable
+        parameter (where it passes through x = 1/2), followed towards the
+        extrapolated bifurcation and corrected with a joint Newton solve on (x, r).
+
+        :param n_max: Number of bifurcation points to locate.
+        :return: Array of r_n values.
+        """
+        x, r = solve_doubling(2.0 / 3.0, 0.75, 1)
+        self.r_values, self.x_values = [r], [x]
+        gap = 0.1
+        for n in range(2, n_max + 1):
+            period = 2 ** (n - 1)
+            r_super = self.superstable(r + 0.5 * gap, period)
+            if np.isnan(r_super) or r_super <= r:
+                break
+            r_guess = r + gap
+            x_next = self.track(0.5, r_super, r_guess, period)
+            x_new, r_new = solve_doubling(x_next, r_guess, period)
+            if np.isnan(r_new) or r_new <= r:
+                break
+            gap = (r_new - r) / self.delta_guess
+            x, r = x_new, r_new
+            self.r_values.append(r)
+            self.x_values.append(x)
+        return np.array(self.r_values)
+
+    # ****************************************
+    # Feigenbaum Constant
+    # ****************************************
+    def delta_estimates(self):
+        """
+        Returns the estimates delta_n = (r_n - r_{n-1}) / (r_{n+1} - r_n).
+        """
+        r = np.array(self.r_values)
+        gaps = np.diff(r)
+        return gaps[:-1] / gaps[1:]
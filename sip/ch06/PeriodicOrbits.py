@@ -0,0 +1,106 @@
+import numpy as np
+
+# ****************************************
+# Logistic Map and Chain-Rule Derivative
+# ****************************************
+def logistic_orbit(x, r, period):
+    """
+    Iterates the logistic map f(x) = 4 r x (1 - x) and propagates the derivative
+    of f^period by the chain rule.
+
+    :param x: Array of starting points.
+    :param r: Array of r values broadcastable against x.
+    :param period: Number of iterations.
+    :return: Tuple (f^period(x), d f^period / dx).
+    """
+    y, r = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(r, dtype=float))
+    dy = np.ones(y.shape)
+    for _ in range(period):
+        dy = dy * (4 * r * (1 - 2 * y))
+        y = 4 * r * y * (1 - y)
+    return y, dy
+
+def minimal_period(x, r, period, tol=1e-8):
+    """
+    Returns the smallest divisor d of period with f^d(x) = x.
+
+    :param x: Array of period-p points.
+    :param r: Array of r values broadcastable against x.
+    :param period: The period p the points were found for.
+    :param tol: Tolerance on |f^d(x) - x|.
+    """
+    x = np.asarray(x, dtype=float)
+    result = np.full(x.shape, period)
+    y = x.copy()
+    for d in range(1, period):
+        y = 4 * r * y * (1 - y)
+        if period % d == 0:
+            hit = (result == period) & (np.abs(y - x) < tol)
+            result[hit] = d
+    return np.where(np.isnan(x), 0, result)
+
+# ****************************************
+# All Period-p Points
+# ****************************************
+def find_periodic_points(r, period, n_grid=None, tol=1e-12, max_iter=100):
+    """
+    Finds every solution of f^p(x) = x on [0, 1] for an array of r values.
+
+    f^p(x) - x is sampled on a dense cosine-spaced grid, every sign change is bracketed and all
+    brackets are refined together with safeguarded Newton steps that fall back to
+    bisection whenever the Newton iterate leaves its bracket.
+
+    :param r: Scalar or array of r values.
+    :param period: The period p.
+    :param n_grid: Number of grid points, defaults to 64 * 2**period (capped).
+    :param tol: Absolute tolerance on the bracket width.
+    :param max_iter: Maximum number of refinement iterations.
+    :return: Tuple (points, multipliers), arrays of shape (len(r), max_roots) padded
+             with NaN and sorted in x. The multiplier is d f^p / dx at each point.
+    """
+    r = np.atleast_1d(np.asarray(r, dtype=float))
+    if n_grid is None:
+        n_grid = min(64 * 2 ** period, 2 ** 22)
+    # cosine spacing resolves the roots that crowd against x = 0 and x = 1
+    grid = 0.5 * (1 - np.cos(np.linspace(0.0, np.pi, n_grid)))
+    g = logistic_orbit(grid[None, :], r[:, None], period)[0] - grid[None, :]
+
+    # exact zeros on the grid plus strict sign changes between neighbours
+    zero_rows, zero_cols = np.nonzero(g == 0)
+    change = np.signbit(g[:, :-1]) != np.signbit(g[:, 1:])
+    change &= (g[:, :-1] != 0) & (g[:, 1:] != 0)
+    rows, cols = np.nonzero(change)
+
+    a, b = grid[cols], grid[cols + 1]
+    rb = r[rows]
+    ga = g[rows, cols]
+    x = 0.5 * (a + b)
+    for _ in range(max_iter):
+        fx, dfx = logistic_orbit(x, rb, period)
+        fx -= x
+        dfx -= 1
+        left = np.signbit(fx) == np.signbit(ga)
+        a = np.where(left, x, a)
+        ga = np.where(left, fx, ga)
+        b = np.where(left, b, x)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = x - fx / dfx
+        inside = (newton > a) & (newton < b)
+        x = np.where(inside, newton, 0.5 * (a + b))
+        if np.all((b - a < tol) | (fx == 0) | (np.abs(fx) < tol * 1e-3)):
+            break
+
+    rows = np.concatenate([rows, zero_rows])
+    x = np.concatenate([x, grid[zero_cols]])
+    order = np.lexsort((x, rows))
+    rows, x = rows[order], x[order]
+
+    counts = np.bincount(rows, minlength=len(r))
+    width = counts.max() if len(counts) else 0
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    slot = np.arange(len(rows)) - starts[rows]
+    points = np.full((len(r), width), np.nan)
+    points[rows, slot] = x
+    multipliers = np.full((len(r), width), np.nan)
+    multipliers[rows, slot] = logistic_orbit(x, r[rows], period)[1]
+    return points, multipliers
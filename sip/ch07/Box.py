@@ -1,4 +1,5 @@
 import numpy as np
+from BufferedRandom import BufferedRandom
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 
@@ -9,15 +10,20 @@ class Box:
     """
     Box contains data for particles in a partitioned box.
     """
-    def __init__(self, N):
+    def __init__(self, N, particles=True, rng=None):
         """
         Initializes the box with N particles.
         
         :param N: The number of particles.
+        :param particles: If False, only the occupancy nleft is evolved and positions
+                          are materialized on demand for display.
+        :param rng: numpy Generator, seed or None; scalar draws are block-buffered.
         """
+        self.rng = BufferedRandom(rng)
         self.N = N
-        self.x = np.zeros(N)
-        self.y = np.zeros(N)
+        self.particles = particles
+        self.x = np.zeros(N if particles else 0)
+        self.y = np.zeros(N if particles else 0)
         self.nleft = 0
         self.time = 0
         self.initialize()
@@ -31,8 +37,9 @@ class Box:
         """
         self.nleft = self.N  # Start with all particles on the left
         self.time = 0
-        self.x = 0.5 * np.random.rand(self.N)
-        self.y = np.random.rand(self.N)
+        if self.particles:
+            self.x = 0.5 * self.rng.random(self.N)
+            self.y = self.rng.random(self.N)
 
     # ****************************************
     # Simulation and Drawing
@@ -41,15 +48,122 @@ class Box:
         """
         Moves one particle to the other side.
         """
-        i = np.random.randint(0, self.N)
+        i = self.rng.integers(0, self.N)
         if self.x[i] < 0.5:
             self.nleft -= 1  # Move to right
-            self.x[i] = 0.5 * (1 + np.random.rand())
+            self.x[i] = 0.5 * (1 + self.rng.random())
         else:
             self.nleft += 1  # Move to left
-            self.x[i] = 0.5 * np.random.rand()
+            self.x[i] = 0.5 * self.rng.random()
         self.time += 1
 
+    def run(self, k, block=65536, record=False):
+        """
+        Advances k moves using pre-drawn blocks of particle indices.
+
+        Within a block, the side of each picked particle before its move is its side
+        at the start of the block flipped once per earlier pick, so nleft is updated
+        incrementally without rescanning the particles.
+
+        :param k: Number of moves.
+        :param block: Number of moves drawn per block.
+        :param record: If True, return nleft after every move.
+        :return: Array of nleft after each move if record, else None.
+        """
+        if not self.particles or self.N == 0:
+            return self.run_occupancy(k, record=record)
+        history = np.empty(k, dtype=np.int64) if record else None
+        done = 0
+        while done < k:
+            m = min(block, k - done)
+            idx = self.rng.integers(0, self.N, size=m)
+            order = np.argsort(idx, kind='stable')
+            sorted_idx = idx[order]
+            first = np.concatenate([[True], sorted_idx[1:] != sorted_idx[:-1]])
+            group_start = np.maximum.accumulate(np.where(first, np.arange(m), 0))
+            rank = np.empty(m, dtype=np.int64)
+            rank[order] = np.arange(m) - group_start
+
+            was_left = (self.x[idx] < 0.5) ^ (rank % 2 == 1)
+            nleft = self.nleft + np.cumsum(np.where(was_left, -1, 1))
+            if record:
+                history[done:done + m] = nleft
+            self.nleft = int(nleft[-1])
+
+            # only the last pick of each particle decides its final side
+            last = np.concatenate([sorted_idx[1:] != sorted_idx[:-1], [True]])
+            moved = sorted_idx[last]
+            to_right = was_left[order][last]
+            self.x[moved] = 0.5 * (self.rng.random(len(moved)) + to_right)
+            self.y[moved] = self.rng.random(len(moved))
+            done += m
+        self.time += k
+        return history
+
+    def run_occupancy(self, k, jump=None, record=False):
+        """
+        Advances the particle-free occupancy chain by k moves.
+
+        With jump == 1 every move is an exact Ehrenfest move: a random particle changes
+        sides, so nleft drops by one with probability nleft / N and rises by one
+        otherwise. This is the same law as run, at a cost of one draw per move.
+
+        With jump > 1 the chain advances the continuous-time Ehrenfest model, in which
+        each particle flips independently at rate 1 / N (one move per unit time on
+        average), over time intervals of length jump. Over a time t a particle has
+        flipped an odd number of times with probability q = (1 - exp(-2 t / N)) / 2,
+        so nleft jumps exactly to Binomial(nleft, 1 - q) + Binomial(N - nleft, q), at a
+        cost independent of N. It matches the discrete chain in the mean relaxation of
+        nleft and in the equilibrium distribution, but not move by move.
+
+        :param k: Number of moves, or the elapsed time when jump > 1.
+        :param jump: Moves per update, defaults to max(1, N // 100), i.e. exact moves
+                     for fewer than 200 particles.
+        :param record: If True, return nleft after every update.
+        :return: Array of nleft after each update if record, else None.
+        """
+        jump = max(1, self.N // 100) if jump is None else jump
+        if jump == 1 or self.N == 0:
+            history = np.empty(k, dtype=np.int64) if record else None
+            for j in range(k):
+                if self.N > 0:
+                    self.nleft += -1 if self.rng.random() * self.N < self.nleft else 1
+                if record:
+                    history[j] = self.nleft
+            self.time += k
+            return history
+        n_jumps, remainder = divmod(k, jump)
+        sizes = [jump] * n_jumps + ([remainder] if remainder else [])
+        history = np.empty(len(sizes), dtype=np.int64) if record else None
+        for j, t in enumerate(sizes):
+            q = -0.5 * np.expm1(-2.0 * t / self.N)
+            stay = self.rng.binomial(self.nleft, 1.0 - q)
+            arrive = self.rng.binomial(self.N - self.nleft, q)
+            self.nleft = int(stay + arrive)
+            if record:
+                history[j] = self.nleft
+        self.time += k
+        return history
+
+    def positions(self, max_points=None):
+        """
+        Returns particle positions for display.
+
+        In particle-free mode positions are drawn uniformly on each side to match
+        nleft, scaled down to at most max_points particles.
+
+        :param max_points: Maximum number of particles returned.
+        :return: Tuple (x, y).
+        """
+        if self.particles:
+            if max_points is None or max_points >= self.N:
+                return self.x, self.y
+            return self.x[:max_points], self.y[:max_points]
+        n = self.N if max_points is None else min(self.N, max_points)
+        n_left = int(round(n * self.nleft / self.N)) if self.N else 0
+        x = np.concatenate([0.5 * self.rng.random(n_left), 0.5 * (1 + self.rng.random(n - n_left))])
+        return x, self.rng.random(n)
+
     def draw(self, ax):
         """
         Draws particles and the partitioned box on a Matplotlib Axes object.
@@ -59,5 +173,6 @@ class Box:
         ax.set_ylim(0, 1)
         ax.axvline(0.5, ymin=0.55, ymax=1.0, color='black')
         ax.axvline(0.5, ymin=0, ymax=0.45, color='black')
-        ax.scatter(self.x, self.y, s=10, color='red')
+        x, y = self.positions(max_points=10000)
+        ax.scatter(x, y, s=10, color='red')
         ax.set_title(f"Time: {self.time}, N_left: {self.nleft}")
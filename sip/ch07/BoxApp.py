@@ -1,7 +1,7 @@
 import streamlit as st
-import numpy as np
 import matplotlib.pyplot as plt
 import time
+from Box import Box
 
 # ****************************************
 # Page Configuration and Title
@@ -15,24 +15,24 @@ st.write("This app simulates the approach to equilibrium for particles in a part
 # ****************************************
 st.sidebar.header("Parameters")
 n_particles = st.sidebar.number_input("Number of particles", value=64, step=1)
+steps_per_frame = st.sidebar.number_input("Moves per frame", value=1, step=1, min_value=1)
+occupancy_only = st.sidebar.checkbox("Occupancy chain only (no particle positions)", value=False)
+seed = st.sidebar.number_input("Random seed (-1 for a fresh one)", value=-1, step=1)
+seed = None if seed < 0 else int(seed)
 
 if 'running' not in st.session_state:
     st.session_state.running = False
 
 if st.sidebar.button("Start/Stop"):
     st.session_state.running = not st.session_state.running
-    st.session_state.particles = np.random.rand(n_particles, 2)
-    st.session_state.particles[:, 0] *= 0.5 # Start all on the left side
+    st.session_state.box = Box(n_particles, particles=not occupancy_only, rng=seed)
     st.session_state.n_left_history = [n_particles]
     st.session_state.time_history = [0]
-    st.session_state.time = 0
 
-if 'particles' not in st.session_state:
-    st.session_state.particles = np.random.rand(n_particles, 2)
-    st.session_state.particles[:, 0] *= 0.5 # Start all on the left side
+if 'box' not in st.session_state:
+    st.session_state.box = Box(n_particles, particles=not occupancy_only, rng=seed)
     st.session_state.n_left_history = [n_particles]
     st.session_state.time_history = [0]
-    st.session_state.time = 0
 
 # ****************************************
 # UI Layout
@@ -50,31 +50,31 @@ with col2:
 # ****************************************
 # Simulation Loop
 # ****************************************
-while st.session_state.running:
-    # Move a random particle
-    particle_to_move = np.random.randint(n_particles)
-    st.session_state.particles[particle_to_move] = np.random.rand(2)
-    
-    n_left = np.sum(st.session_state.particles[:, 0] < 0.5)
-    st.session_state.time += 1
-    
-    st.session_state.n_left_history.append(n_left)
-    st.session_state.time_history.append(st.session_state.time)
+fig1, ax1 = plt.subplots()
+fig2, ax2 = plt.subplots()
+ax2.set_xlabel("Time")
+ax2.set_ylabel("Number on Left")
+history_line, = ax2.plot([], [])
 
-    # Update plots
-    fig1, ax1 = plt.subplots()
-    ax1.plot(st.session_state.particles[:, 0], st.session_state.particles[:, 1], 'o')
-    ax1.axvline(0.5, color='r', linestyle='--')
-    ax1.set_xlim(0, 1)
-    ax1.set_ylim(0, 1)
-    plot_placeholder.pyplot(fig1)
-    plt.close(fig1)
+try:
+    while st.session_state.running:
+        # Advance a block of moves; nleft is tracked incrementally by the model
+        box = st.session_state.box
+        box.run(steps_per_frame)
 
-    fig2, ax2 = plt.subplots()
-    ax2.plot(st.session_state.time_history, st.session_state.n_left_history)
-    ax2.set_xlabel("Time")
-    ax2.set_ylabel("Number on Left")
-    data_placeholder.pyplot(fig2)
-    plt.close(fig2)
+        st.session_state.n_left_history.append(box.nleft)
+        st.session_state.time_history.append(box.time)
+
+        # Update plots
+        box.draw(ax1)
+        plot_placeholder.pyplot(fig1)
+
+        history_line.set_data(st.session_state.time_history, st.session_state.n_left_history)
+        ax2.relim()
+        ax2.autoscale_view()
+        data_placeholder.pyplot(fig2)
     
-    time.sleep(0.01)
+        time.sleep(0.01)
+finally:
+    plt.close(fig1)
+    plt.close(fig2)
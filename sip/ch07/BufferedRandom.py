@@ -0,0 +1,75 @@
+from collections import OrderedDict
+import numpy as np
+
+# ****************************************
+# BufferedRandom Class
+# ****************************************
+class BufferedRandom:
+    """
+    Drop-in facade for a numpy Generator that serves scalar draws from pre-generated
+    blocks. Scalar random(), integers(low, high) and standard_normal() calls become a
+    cheap next() on a list iterator; array-sized calls and every other Generator method
+    are forwarded to the wrapped Generator.
+    """
+    # number of (low, high) integer ranges that keep a buffer
+    INTEGER_RANGES = 8
+
+    def __init__(self, rng=None, block=65536):
+        """
+        :param rng: numpy Generator, seed or None.
+        :param block: Number of values generated per refill.
+        """
+        self.generator = rng.generator if isinstance(rng, BufferedRandom) else np.random.default_rng(rng)
+        self.block = block
+        self._uniform = iter(())
+        self._normal = iter(())
+        self._integers = OrderedDict()
+
+    def __getattr__(self, name):
+        if name == 'generator':
+            raise AttributeError(name)
+        return getattr(self.generator, name)
+
+    # ****************************************
+    # Buffered Draws
+    # ****************************************
+    def random(self, size=None):
+        """
+        Uniform draw on [0, 1); a scalar when size is None.
+        """
+        if size is not None:
+            return self.generator.random(size)
+        try:
+            return next(self._uniform)
+        except StopIteration:
+            self._uniform = iter(self.generator.random(self.block).tolist())
+            return next(self._uniform)
+
+    def standard_normal(self, size=None):
+        """
+        Standard normal draw; a scalar when size is None.
+        """
+        if size is not None:
+            return self.generator.standard_normal(size)
+        try:
+            return next(self._normal)
+        except StopIteration:
+            self._normal = iter(self.generator.standard_normal(self.block).tolist())
+            return next(self._normal)
+
+    def integers(self, low, high=None, size=None):
+        """
+        Integer draw on [low, high); a scalar when size is None. The most recently used
+        (low, high) ranges keep their own buffers, at most INTEGER_RANGES of them.
+        """
+        if size is not None:
+            return self.generator.integers(low, high, size)
+        key = (low, high)
+        try:
+            self._integers.move_to_end(key)
+            return next(self._integers[key])
+        except (KeyError, StopIteration):
+            self._integers[key] = iter(self.generator.integers(low, high, self.block).tolist())
+            if len(self._integers) > self.INTEGER_RANGES:
+                self._integers.popitem(last=False)
+            return next(self._integers[key])
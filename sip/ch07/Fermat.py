@@ -1,4 +1,6 @@
 import numpy as np
+from scipy.linalg import LinAlgError, solveh_banded
+from BufferedRandom import BufferedRandom
 
 # ****************************************
 # Fermat Class
@@ -7,20 +9,23 @@ class Fermat:
     """
     Represents a light ray passing through media with varying indices of refraction.
     """
-    def __init__(self, N, dn, dy=0.1):
+    def __init__(self, N, dn, dy=0.1, rng=None):
         """
         Initializes the simulation parameters.
         
         :param N: Number of media.
         :param dn: Change in the index of refraction between media.
         :param dy: Maximum change in the y-position for each step.
+        :param rng: numpy Generator, seed or None; scalar draws are block-buffered.
         """
+        self.rng = BufferedRandom(rng)
         self.N = N
         self.dn = dn
         self.dy = dy
         self.y = np.zeros(N + 1)
         self.v = np.zeros(N)
         self.steps = 0
+        self.total_time = 0.0
         self.initialize()
 
     # ****************************************
@@ -30,12 +35,14 @@ class Fermat:
         """
         Initializes the arrays for the simulation.
         """
-        self.y = np.arange(self.N + 1)
+        self.y = np.arange(self.N + 1, dtype=float)
         index_of_refraction = 1.0
         for i in range(self.N):
             self.v[i] = 1.0 / index_of_refraction
             index_of_refraction += self.dn
         self.steps = 0
+        self.segment_times = self.compute_segment_times()
+        self.total_time = self.segment_times.sum()
 
     # ****************************************
     # Simulation Step
@@ -44,8 +51,8 @@ class Fermat:
         """
         Performs a random change in the path and accepts it if it reduces the travel time.
         """
-        i = np.random.randint(1, self.N)
-        y_trial = self.y[i] + 2.0 * self.dy * (np.random.rand() - 0.5)
+        i = self.rng.integers(1, self.N)
+        y_trial = self.y[i] + 2.0 * self.dy * (self.rng.random() - 0.5)
         
         # Time in the previous configuration
         prev_time = (np.sqrt((self.y[i-1] - self.y[i])**2 + 1) / self.v[i-1] +
@@ -57,5 +64,127 @@ class Fermat:
         
         if trial_time < prev_time:
             self.y[i] = y_trial
+            self.segment_times[i-1:i+1] = (np.sqrt((self.y[i-1:i+1] - self.y[i:i+2])**2 + 1) /
+                                           self.v[i-1:i+1])
+            self.total_time += trial_time - prev_time
             
         self.steps += 1
+
+    # ****************************************
+    # Checkerboard Optimizer
+    # ****************************************
+    def compute_segment_times(self):
+        """
+        Returns the travel time through each medium.
+        """
+        return np.sqrt(np.diff(self.y)**2 + 1) / self.v
+
+    def sweep(self, temperature=0.0):
+        """
+        Proposes a move for every interior vertex, all even-indexed vertices at once and
+        then all odd-indexed ones. Vertices of equal parity share no segment, so their
+        time changes are independent. Moves are accepted greedily when temperature is
+        zero and with the Metropolis rule otherwise; the total time is updated
+        incrementally.
+
+        :param temperature: Annealing temperature in units of time.
+        :return: Fraction of accepted moves.
+        """
+        accepted = 0
+        for parity in (2, 1):
+            i = np.arange(parity, self.N, 2)
+            if len(i) == 0:
+                continue
+            y_trial = self.y[i] + 2.0 * self.dy * (self.rng.random(len(i)) - 0.5)
+            left = np.sqrt((self.y[i - 1] - y_trial)**2 + 1) / self.v[i - 1]
+            right = np.sqrt((self.y[i + 1] - y_trial)**2 + 1) / self.v[i]
+            delta = left + right - self.segment_times[i - 1] - self.segment_times[i]
+            if temperature > 0:
+                accept = self.rng.random(len(i)) < np.exp(-np.maximum(delta, 0) / temperature)
+            else:
+                accept = delta < 0
+            i = i[accept]
+            self.y[i] = y_trial[accept]
+            self.segment_times[i - 1] = left[accept]
+            self.segment_times[i] = right[accept]
+            self.total_time += delta[accept].sum()
+            accepted += len(i)
+        self.steps += self.N - 1
+        return accepted / max(self.N - 1, 1)
+
+    def anneal(self, n_sweeps, t_start=0.0, t_end=0.0, adapt=True):
+        """
+        Runs n_sweeps checkerboard sweeps with a geometric temperature schedule.
+
+        :param n_sweeps: Number of sweeps.
+        :param t_start: Initial temperature; zero gives a greedy descent.
+        :param t_end: Final temperature.
+        :param adapt: If True, rescale dy to keep the acceptance near 30% during this
+                      run; dy is restored afterwards.
+        """
+        if t_start > 0 and t_end > 0:
+            temperatures = np.geomspace(t_start, t_end, n_sweeps)
+        else:
+            temperatures = np.zeros(n_sweeps)
+        dy = self.dy
+        try:
+            for temperature in temperatures:
+                acceptance = self.sweep(temperature)
+                if adapt:
+                    self.dy *= 1.1 if acceptance > 0.3 else 0.9
+        finally:
+            self.dy = dy
+        # remove accumulated rounding from the incremental updates
+        self.total_time = self.segment_times.sum()
+
+    def minimize(self, tol=1e-12, max_iter=100):
+        """
+        Converges the path directly with Newton's method. The total time is a convex
+        function of the interior y values with a tridiagonal Hessian, so each step is
+        one banded solve. Steps are scaled so that no segment's rise changes by more than
+        the segment's length, which keeps early steps from overshooting into overflow;
+        where the Hessian is not usable the step falls back to steepest descent.
+
+        :param tol: Tolerance on the largest Newton update.
+        :param max_iter: Maximum number of Newton iterations.
+        """
+        if self.N < 2:
+            # no interior points, the path is fixed
+            return
+        for _ in range(max_iter):
+            d = np.diff(self.y)
+            s = np.sqrt(d**2 + 1)
+            slope = d / (self.v * s)
+            w = 1.0 / (self.v * s**3)
+            gradient = slope[:-1] - slope[1:]
+            step = None
+            if np.all(np.isfinite(w) & (w > 0)):
+                banded = np.zeros((2, self.N - 1))
+                banded[0, 1:] = -w[1:-1]
+                banded[1] = w[:-1] + w[1:]
+                try:
+                    # with one interior point the Hessian is 1x1 and has no off-diagonal band
+                    step = solveh_banded(banded if self.N > 2 else banded[1:], gradient)
+                except LinAlgError:
+                    pass
+            if step is None or not np.all(np.isfinite(step)):
+                step = gradient
+            # trust region: no segment's rise changes by more than the segment's length
+            change = np.max(np.abs(np.diff(step, prepend=0.0, append=0.0)) / s)
+            if change > 1.0:
+                step /= change
+            # backtrack until the travel time decreases
+            y_old, times_old, t_old, scale = self.y.copy(), self.segment_times, self.total_time, 1.0
+            while True:
+                self.y[1:-1] = y_old[1:-1] - scale * step
+                self.segment_times = self.compute_segment_times()
+                self.total_time = self.segment_times.sum()
+                if self.total_time <= t_old:
+                    break
+                scale *= 0.5
+                if scale < 1e-8:
+                    # no decrease at round-off level, keep the previous path
+                    self.y, self.segment_times, self.total_time = y_old, times_old, t_old
+                    return
+            if np.max(np.abs(scale * step)) < tol:
+                break
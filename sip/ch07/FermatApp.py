@@ -1,7 +1,8 @@
 import streamlit as st
-import numpy as np
 import matplotlib.pyplot as plt
 import time
+from scipy.linalg import LinAlgError
+from Fermat import Fermat
 
 # ****************************************
 # Page Configuration and Title
@@ -17,21 +18,30 @@ st.sidebar.header("Parameters")
 dn = st.sidebar.number_input("Change in index of refraction", value=0.5)
 N = st.sidebar.number_input("Number of media segments", value=2, step=1)
 n_steps = st.sidebar.number_input("Number of simulation steps", value=100, step=10)
+sweeps_per_frame = st.sidebar.number_input("Checkerboard sweeps per frame", value=10, step=1, min_value=1)
+temperature = st.sidebar.number_input("Annealing temperature (0 = greedy)", value=0.0, format="%.5f")
+seed = st.sidebar.number_input("Random seed (-1 for a fresh one)", value=-1, step=1)
+seed = None if seed < 0 else int(seed)
 
 if 'running' not in st.session_state:
     st.session_state.running = False
 
 if st.sidebar.button("Start/Stop"):
     st.session_state.running = not st.session_state.running
-    st.session_state.y = np.linspace(1, 0, N + 1)
-    st.session_state.n = 1 + dn * np.arange(N + 1) / N
+    st.session_state.fermat = Fermat(N, dn, rng=seed)
     st.session_state.step = 0
 
-if 'y' not in st.session_state:
-    st.session_state.y = np.linspace(1, 0, N + 1)
-    st.session_state.n = 1 + dn * np.arange(N + 1) / N
+# rebuild the path when the media change, so the plot and Minimize match the inputs
+if 'fermat' not in st.session_state or (st.session_state.fermat.N, st.session_state.fermat.dn) != (N, dn):
+    st.session_state.fermat = Fermat(N, dn, rng=seed)
     st.session_state.step = 0
 
+if st.sidebar.button("Minimize (Newton)"):
+    try:
+        st.session_state.fermat.minimize()
+    except LinAlgError as e:
+        st.error(f"Newton minimization failed: {e}")
+
 # ****************************************
 # UI Layout
 # ****************************************
@@ -41,20 +51,25 @@ plot_placeholder = st.empty()
 # ****************************************
 # Simulation Loop
 # ****************************************
-while st.session_state.running and st.session_state.step < n_steps:
-    i = np.random.randint(1, N)
-    y_old = st.session_state.y[i]
-    
-    # Simplified version of the minimization step
-    st.session_state.y[i] += (np.random.rand() - 0.5) * 0.1
-    
-    st.session_state.step += 1
+fig, ax = plt.subplots()
+ax.set_xlabel("x")
+ax.set_ylabel("y")
+path_line, = ax.plot(range(len(st.session_state.fermat.y)), st.session_state.fermat.y, 'o-')
 
-    fig, ax = plt.subplots()
-    ax.plot(range(N + 1), st.session_state.y, 'o-')
-    ax.set_xlabel("x")
-    ax.set_ylabel("y")
+def update_plot():
+    fermat = st.session_state.fermat
+    path_line.set_data(range(len(fermat.y)), fermat.y)
+    ax.relim()
+    ax.autoscale_view()
+    ax.set_title(f"Sweeps: {st.session_state.step}, travel time: {fermat.total_time:.6f}")
     plot_placeholder.pyplot(fig)
-    plt.close(fig)
+
+update_plot()
+
+while st.session_state.running and st.session_state.step < n_steps:
+    st.session_state.fermat.anneal(sweeps_per_frame, temperature, temperature)
+    st.session_state.step += sweeps_per_frame
+
+    update_plot()
     
     time.sleep(0.01)
@@ -0,0 +1,202 @@
+import numpy as np
+from RandomStreams import run_ensemble
+
+# ****************************************
+# ReactionNetwork Class
+# ****************************************
+class ReactionNetwork:
+    """
+    A network of first-order reactions: reaction j fires at rate rate_j * x[reactant_j]
+    and changes the species counts by change_j.
+    """
+    def __init__(self, n_species, names=None):
+        """
+        :param n_species: Number of species.
+        :param names: Optional species names.
+        """
+        self.n_species = n_species
+        self.names = names if names is not None else [str(i) for i in range(n_species)]
+        self.reactants = []
+        self.rates = []
+        self.changes = []
+
+    def add_reaction(self, reactant, change, rate):
+        """
+        Adds a reaction.
+
+        :param reactant: Index of the species whose count sets the propensity.
+        :param change: Sequence of n_species count changes.
+        :param rate: Rate constant per reactant particle.
+        """
+        self.reactants.append(reactant)
+        self.changes.append(np.asarray(change, dtype=np.int64))
+        self.rates.append(float(rate))
+
+    def propensities(self, x):
+        """
+        Returns the propensities of all reactions for states x of shape (replicas, n_species).
+        """
+        return x[:, self.reactants] * np.asarray(self.rates)
+
+    @property
+    def stoichiometry(self):
+        """
+        Matrix of shape (n_reactions, n_species) of count changes.
+        """
+        return np.array(self.changes)
+
+# ****************************************
+# Networks for the ch07 Models
+# ****************************************
+def decay_network(rates):
+    """
+    Decay chain A -> B -> C -> ... for Nuclei; species i decays with rates[i] and the
+    last species is stable. A per-step decay probability p corresponds to the rate
+    -log(1 - p).
+    """
+    n = len(rates) + 1
+    network = ReactionNetwork(n, [chr(ord('A') + i) for i in range(n)])
+    for i, rate in enumerate(rates):
+        change = np.zeros(n, dtype=np.int64)
+        change[i], change[i + 1] = -1, 1
+        network.add_reaction(i, change, rate)
+    return network
+
+def box_network(N, rate=1.0):
+    """
+    Left/right hops for Box. With rate 1/N per particle, one unit of time corresponds
+    to one attempted move of the discrete model.
+    """
+    network = ReactionNetwork(2, ["left", "right"])
+    network.add_reaction(0, [-1, 1], rate / N)
+    network.add_reaction(1, [1, -1], rate / N)
+    return network
+
+# ****************************************
+# KineticMonteCarlo Class
+# ****************************************
+class KineticMonteCarlo:
+    """
+    Continuous-time kinetic Monte Carlo for a ReactionNetwork, running an ensemble of
+    replicas together with exact Gillespie steps or adaptive tau-leaps.
+    """
+    def __init__(self, network, epsilon=0.03, n_exact=10.0, rng=None):
+        """
+        :param network: The ReactionNetwork.
+        :param epsilon: Tau-leap accuracy, the allowed relative change of propensities.
+        :param n_exact: Replicas whose leap would cover fewer than n_exact expected
+                        events take an exact Gillespie step instead.
+        :param rng: numpy Generator, SeedSequence, seed or None.
+        """
+        self.rng = np.random.default_rng(rng)
+        self.network = network
+        self.epsilon = epsilon
+        self.n_exact = n_exact
+
+    def run(self, x0, t_grid, replicas=1, method='gillespie', workers=1):
+        """
+        Simulates all replicas up to t_grid[-1].
+
+        :param x0: Initial species counts.
+        :param t_grid: Increasing output times.
+        :param replicas: Number of independent replicas.
+        :param method: 'gillespie' for exact event times, 'tau' for adaptive tau-leaping.
+        :param workers: Number of worker threads, each running a share of the replicas
+                        with its own random stream.
+        :return: Array of shape (replicas, len(t_grid), n_species) with the state at each
+                 grid time.
+        """
+        t_grid = np.asarray(t_grid, dtype=float)
+        simulate = lambda rng, count: self._simulate(rng, x0, t_grid, count, method)
+        return np.concatenate(run_ensemble(self.rng, replicas, simulate, workers))
+
+    def _simulate(self, rng, x0, t_grid, replicas, method):
+        """
+        Runs one group of replicas drawing from rng; see run.
+        """
+        nu = self.network.stoichiometry
+        x = np.tile(np.asarray(x0, dtype=np.int64), (replicas, 1))
+        t = np.zeros(replicas)
+        next_out = np.zeros(replicas, dtype=np.int64)
+        out = np.empty((replicas, len(t_grid), self.network.n_species), dtype=np.int64)
+        t_end = t_grid[-1]
+
+        tau_scale = np.ones(replicas)
+        active = np.ones(replicas, dtype=bool)
+        while np.any(active):
+            idx = np.nonzero(active)[0]
+            a = self.network.propensities(x[idx])
+            a0 = a.sum(axis=1)
+            with np.errstate(divide='ignore'):
+                dt_exact = np.where(a0 > 0, rng.exponential(1.0, len(idx)) / a0, np.inf)
+
+            t_new = t[idx] + dt_exact
+            x_new = x[idx].copy()
+            fires = np.isfinite(dt_exact) & (t[idx] + dt_exact <= t_end)
+
+            if method == 'tau':
+                tau = self._leap_size(x[idx], a, nu) * tau_scale[idx]
+                # leaps end on grid times so outputs are written exactly there
+                following = np.searchsorted(t_grid, t[idx], side='right')
+                tau = np.minimum(tau, t_grid[np.minimum(following, len(t_grid) - 1)] - t[idx])
+                leap = (tau * a0 >= self.n_exact) & (tau > 0)
+                if np.any(leap):
+                    k = rng.poisson(a[leap] * tau[leap, None])
+                    x_leap = x[idx[leap]] + k @ nu
+                    # reject leaps that overdraw a species; they retry with tau / 2
+                    ok = np.all(x_leap >= 0, axis=1)
+                    leap_idx = np.nonzero(leap)[0]
+                    x_new[leap_idx[ok]] = x_leap[ok]
+                    t_new[leap_idx[ok]] = t[idx[leap_idx[ok]]] + tau[leap_idx[ok]]
+                    t_new[leap_idx[~ok]] = t[idx[leap_idx[~ok]]]
+                    tau_scale[idx[leap_idx]] = np.where(ok, 1.0, 0.5 * tau_scale[idx[leap_idx]])
+                    fires &= ~leap
+            else:
+                leap = np.zeros(len(idx), dtype=bool)
+
+            if np.any(fires):
+                u = rng.random(np.count_nonzero(fires)) * a0[fires]
+                reaction = np.argmax(np.cumsum(a[fires], axis=1) > u[:, None], axis=1)
+                x_new[fires] += nu[reaction]
+
+            t_new = np.where(fires | leap, t_new, np.inf)
+            self._record(out, t_grid, idx, x[idx], t_new, next_out)
+            done = ~(fires | leap)
+            x[idx], t[idx] = x_new, np.where(done, t_end, t_new)
+            active[idx[done]] = False
+        return out
+
+    def _leap_size(self, x, a, nu):
+        """
+        Cao-Gillespie-Petzold tau selection bounding the relative change of every species.
+        """
+        mu = a @ nu
+        sigma2 = a @ (nu * nu)
+        bound = np.maximum(self.epsilon * x, 1.0)
+        with np.errstate(divide='ignore'):
+            tau_mu = np.where(mu != 0, bound / np.abs(mu), np.inf)
+            tau_sigma = np.where(sigma2 > 0, bound**2 / sigma2, np.inf)
+        return np.min(np.minimum(tau_mu, tau_sigma), axis=1)
+
+    @staticmethod
+    def _record(out, t_grid, idx, x_old, t_new, next_out):
+        """
+        Writes x_old to every grid time before t_new that has not been written yet.
+        """
+        stop = np.searchsorted(t_grid, t_new, side='left')
+        count = np.maximum(stop - next_out[idx], 0)
+        if np.any(count > 0):
+            rep = np.repeat(np.arange(len(idx)), count)
+            offset = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+            out[idx[rep], next_out[idx][rep] + offset] = x_old[rep]
+            next_out[idx] = np.maximum(stop, next_out[idx])
+
+    # ****************************************
+    # Ensemble Statistics
+    # ****************************************
+    @staticmethod
+    def mean(out):
+        """
+        Ensemble mean of run output, shape (len(t_grid), n_species).
+        """
+        return out.mean(axis=0)
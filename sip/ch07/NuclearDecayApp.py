@@ -1,6 +1,9 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+from Nuclei import Nuclei
+from KineticMonteCarlo import KineticMonteCarlo, decay_network
+from RandomStreams import RandomStreams
 
 # ****************************************
 # Page Configuration and Title
@@ -17,22 +20,21 @@ n0 = st.sidebar.number_input("Initial number of unstable nuclei", value=1000, st
 p = st.sidebar.number_input("Decay probability", value=0.01, format="%.4f")
 t_max = st.sidebar.number_input("Maximum time to collect data", value=100, step=10)
 n_trials = st.sidebar.number_input("Number of trials", value=100, step=10)
+kmc_method = st.sidebar.selectbox("Continuous-time comparison", ["None", "gillespie", "tau"])
+chain_text = st.sidebar.text_input("Daughter decay probabilities (A->B->C chain, comma separated)", value="")
+seed = st.sidebar.number_input("Random seed (-1 for a fresh one)", value=-1, step=1)
+seed = None if seed < 0 else int(seed)
+workers = st.sidebar.number_input("Worker threads", value=1, step=1, min_value=1)
 
 # ****************************************
 # Simulation Logic
 # ****************************************
 if st.sidebar.button("Run Simulation"):
     
-    n_history = np.zeros(t_max + 1)
-
-    for _ in range(n_trials):
-        n_unstable = n0
-        for t in range(t_max + 1):
-            n_history[t] += n_unstable
-            decayed_this_step = np.sum(np.random.rand(n_unstable) < p)
-            n_unstable -= decayed_this_step
-            
-    n_average = n_history / n_trials
+    streams = RandomStreams(seed)
+    nuclei = Nuclei(t_max, n0, p, rng=streams.generator())
+    nuclei.run(n_trials, workers=workers)
+    n_average = nuclei.n / n_trials
 
     # ****************************************
     # Display Results
@@ -45,11 +47,37 @@ if st.sidebar.button("Run Simulation"):
     t_analytical = np.linspace(0, t_max, 200)
     n_analytical = n0 * np.exp(-p * t_analytical)
     ax.plot(t_analytical, n_analytical, '--', label="Analytical")
+
+    if kmc_method != "None":
+        kmc = KineticMonteCarlo(decay_network([-np.log1p(-p)]), rng=streams.generator())
+        states = kmc.run([n0, 0], np.arange(t_max + 1), replicas=n_trials, method=kmc_method, workers=workers)
+        ax.plot(range(t_max + 1), KineticMonteCarlo.mean(states)[:, 0], ':', label=f"Kinetic MC ({kmc_method})")
     
     ax.set_xlabel("Time")
     ax.set_ylabel("Number of unstable nuclei")
     ax.legend()
     st.pyplot(fig)
+    plt.close(fig)
 
     st.subheader("Data")
     st.dataframe({'Time': range(t_max + 1), 'Average N': n_average})
+
+    try:
+        daughters = [float(v) for v in chain_text.split(",") if v.strip()]
+    except ValueError as e:
+        st.error(f"Error parsing daughter probabilities: '{chain_text}'. {e}")
+        daughters = []
+    if not all(0.0 <= q <= 1.0 for q in daughters):
+        st.error(f"Daughter decay probabilities must lie in [0, 1]: '{chain_text}'.")
+        daughters = []
+    if daughters:
+        st.subheader("Decay Chain")
+        chain = nuclei.run_chain([p] + daughters, n_trials, workers=workers) / n_trials
+        fig_chain, ax_chain = plt.subplots()
+        for i in range(chain.shape[1]):
+            ax_chain.plot(range(t_max + 1), chain[:, i], label=f"Species {chr(ord('A') + i)}")
+        ax_chain.set_xlabel("Time")
+        ax_chain.set_ylabel("Average population")
+        ax_chain.legend()
+        st.pyplot(fig_chain)
+        plt.close(fig_chain)
@@ -1,4 +1,5 @@
 import numpy as np
+from RandomStreams import run_ensemble
 
 # ****************************************
 # Nuclei Class
@@ -7,18 +8,20 @@ class Nuclei:
     """
     Simulates the decay of unstable nuclei.
     """
-    def __init__(self, tmax, n0, p):
+    def __init__(self, tmax, n0, p, rng=None):
         """
         Initializes the simulation parameters.
         
         :param tmax: Maximum time to record data.
         :param n0: Initial number of unstable nuclei.
         :param p: Decay probability.
+        :param rng: numpy Generator, SeedSequence, seed or None.
         """
+        self.rng = np.random.default_rng(rng)
         self.tmax = tmax
         self.n0 = n0
         self.p = p
-        self.n = np.zeros(tmax + 1, dtype=int)
+        self.n = np.zeros(tmax + 1, dtype=np.int64)
 
     # ****************************************
     # Initialization
@@ -27,7 +30,7 @@ class Nuclei:
         """
         Initializes the array for the number of unstable nuclei.
         """
-        self.n = np.zeros(self.tmax + 1, dtype=int)
+        self.n = np.zeros(self.tmax + 1, dtype=np.int64)
 
     # ****************************************
     # Simulation Step
@@ -39,6 +42,58 @@ class Nuclei:
         self.n[0] += self.n0
         n_unstable = self.n0
         for t in range(self.tmax):
-            decays = np.sum(np.random.rand(n_unstable) < self.p)
+            decays = np.sum(self.rng.random(n_unstable) < self.p)
             n_unstable -= decays
             self.n[t + 1] += n_unstable
+
+    def run(self, trials=1, workers=1):
+        """
+        Simulates the decay for all trials at once, sampling the number of decays per
+        time step from a binomial distribution. The cost is independent of n0.
+
+        :param trials: Number of independent trials added to the accumulated data.
+        :param workers: Number of worker threads, each with its own random stream.
+        """
+        def simulate(rng, count):
+            totals = np.zeros(self.tmax + 1, dtype=np.int64)
+            n_unstable = np.full(count, self.n0, dtype=np.int64)
+            totals[0] = self.n0 * count
+            for t in range(self.tmax):
+                n_unstable -= rng.binomial(n_unstable, self.p)
+                totals[t + 1] = n_unstable.sum()
+            return totals
+
+        for totals in run_ensemble(self.rng, trials, simulate, workers):
+            self.n += totals
+
+    def run_chain(self, p_chain, trials=1, workers=1):
+        """
+        Simulates a decay chain A -> B -> C -> ... for all trials at once.
+
+        Species i decays into species i + 1 with probability p_chain[i] per time step;
+        the last species is stable. All decays in a step are drawn from the
+        populations at the start of the step.
+
+        :param p_chain: Decay probabilities of the unstable species, each in [0, 1].
+        :param trials: Number of independent trials.
+        :param workers: Number of worker threads, each with its own random stream.
+        :return: Array of shape (tmax + 1, len(p_chain) + 1) with the populations
+                 summed over trials.
+        """
+        p_chain = np.asarray(p_chain, dtype=float)
+        if np.any((p_chain < 0) | (p_chain > 1)) or np.any(np.isnan(p_chain)):
+            raise ValueError(f"Decay probabilities must lie in [0, 1], got {p_chain.tolist()}.")
+
+        def simulate(rng, count):
+            populations = np.zeros((count, len(p_chain) + 1), dtype=np.int64)
+            populations[:, 0] = self.n0
+            history = np.zeros((self.tmax + 1, len(p_chain) + 1), dtype=np.int64)
+            history[0] = populations.sum(axis=0)
+            for t in range(self.tmax):
+                decays = rng.binomial(populations[:, :-1], p_chain)
+                populations[:, :-1] -= decays
+                populations[:, 1:] += decays
+                history[t + 1] = populations.sum(axis=0)
+            return history
+
+        return sum(run_ensemble(self.rng, trials, simulate, workers))
@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# ****************************************
+# RandomStreams Class
+# ****************************************
+class RandomStreams:
+    """
+    Spawns statistically independent numpy Generator streams from one root SeedSequence,
+    so that model instances, worker processes and ensemble members never share random
+    state and every run can be reproduced from a single entropy value.
+
+    Every stochastic model takes an rng argument, which accepts a Generator, a
+    SeedSequence, an integer seed or None (fresh OS entropy).
+    """
+    def __init__(self, seed=None):
+        """
+        :param seed: Integer seed, SeedSequence or None for fresh OS entropy.
+        """
+        self.root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+    @property
+    def entropy(self):
+        """
+        The root entropy; record it to reproduce a run.
+        """
+        return self.root.entropy
+
+    # ****************************************
+    # Spawning
+    # ****************************************
+    def spawn_seeds(self, n):
+        """
+        Returns n new child SeedSequences. They are picklable, so pass these (not
+        Generators) to worker processes and build the Generator inside the worker.
+        """
+        return self.root.spawn(n)
+
+    def spawn(self, n):
+        """
+        Returns n new independent Generators, e.g. one per ensemble member.
+        """
+        return [np.random.default_rng(s) for s in self.spawn_seeds(n)]
+
+    def generator(self):
+        """
+        Returns one new independent Generator, e.g. for a model instance.
+        """
+        return self.spawn(1)[0]
+
+# ****************************************
+# Ensembles
+# ****************************************
+def spawn(rng, n):
+    """
+    Returns n independent child Generators of rng, which may be a Generator (or a
+    BufferedRandom wrapping one), a SeedSequence, an integer seed or None.
+    """
+    if rng is None or isinstance(rng, (int, np.integer, np.random.SeedSequence)):
+        return RandomStreams(rng).spawn(n)
+    return rng.spawn(n)
+
+def run_ensemble(rng, members, simulate, workers=1):
+    """
+    Splits an ensemble into worker groups and runs simulate(generator, count) for each
+    in a thread pool. Every group draws from its own child stream of rng, so groups
+    never share random state and a seeded run is reproducible for a given number of
+    workers. NumPy's bulk random draws release the GIL.
+
+    :param rng: Parent Generator, SeedSequence, seed or None.
+    :param members: Total number of ensemble members.
+    :param simulate: Callable (generator, count) returning one group's result.
+    :param workers: Number of groups, at most members.
+    :return: List of the group results in order.
+    """
+    workers = max(1, min(workers, members))
+    counts = [members // workers + (i < members % workers) for i in range(workers)]
+    generators = spawn(rng, workers)
+    if workers == 1:
+        return [simulate(generators[0], counts[0])]
+    with ThreadPoolExecutor(workers) as pool:
+        return list(pool.map(simulate, generators, counts))
@@ -1,4 +1,7 @@
 import numpy as np
+from BufferedRandom import BufferedRandom
+from RandomStreams import run_ensemble
+from scipy.stats import binom
 
 # ****************************************
 # Walker Class
@@ -7,18 +10,21 @@ class Walker:
     """
     Simulates a 1D random walk and accumulates data on the walker's displacement.
     """
-    def __init__(self, N, p):
+    def __init__(self, N, p, dim=1, rng=None):
         """
         Initializes the simulation parameters.
         
         :param N: Maximum number of steps.
-        :param p: Probability of a step to the right.
+        :param p: Probability of a step to the right (used for dim=1).
+        :param dim: Lattice dimension (1, 2 or 3) used by run.
+        :param rng: numpy Generator, SeedSequence, seed or None; scalar draws are block-buffered.
         """
+        self.rng = BufferedRandom(rng)
         self.N = N
         self.p = p
-        self.x_accum = np.zeros(N + 1, dtype=int)
-        self.x_squared_accum = np.zeros(N + 1, dtype=int)
+        self.dim = dim
         self.position = 0
+        self.initialize()
 
     # ****************************************
     # Initialization
@@ -26,22 +32,103 @@ class Walker:
     def initialize(self):
         """
         Initializes the walker's data arrays.
+
+        For dim > 1, x_accum holds each coordinate and x_squared_accum holds |r|^2.
+        final_counts[d, x + N] counts walkers ending at coordinate x along axis d.
         """
-        self.x_accum = np.zeros(self.N + 1, dtype=int)
-        self.x_squared_accum = np.zeros(self.N + 1, dtype=int)
+        shape = (self.N + 1,) if self.dim == 1 else (self.N + 1, self.dim)
+        self.x_accum = np.zeros(shape, dtype=np.int64)
+        self.x_squared_accum = np.zeros(self.N + 1, dtype=np.int64)
+        self.final_counts = np.zeros((self.dim, 2 * self.N + 1), dtype=np.int64)
+        self.walkers = 0
 
     # ****************************************
     # Simulation Step
     # ****************************************
     def step(self):
         """
-        Performs a random walk for one walker.
+        Performs a random walk for one walker; for dim > 1 each step moves one unit
+        along a random axis and direction.
         """
-        self.position = 0
+        self.position = 0 if self.dim == 1 else np.zeros(self.dim, dtype=np.int64)
         for t in range(self.N):
-            if np.random.rand() < self.p:
-                self.position += 1
+            if self.dim == 1:
+                self.position += 1 if self.rng.random() < self.p else -1
             else:
-                self.position -= 1
+                direction = self.rng.integers(0, 2 * self.dim)
+                self.position[direction // 2] += 1 - 2 * (direction % 2)
             self.x_accum[t + 1] += self.position
-            self.x_squared_accum[t + 1] += self.position**2
+            self.x_squared_accum[t + 1] += np.sum(np.square(self.position))
+        for d, x in enumerate(np.atleast_1d(self.position)):
+            self.final_counts[d, x + self.N] += 1
+        self.walkers += 1
+
+    def run(self, n_walkers, memory_budget=64 * 2**20, workers=1):
+        """
+        Runs n_walkers independent walkers, generating the steps of a block of
+        walkers at once and accumulating their positions with cumulative sums.
+
+        :param n_walkers: Number of walkers.
+        :param memory_budget: Approximate bytes of scratch memory, shared by the workers.
+        :param workers: Number of worker threads, each running a share of the walkers
+                        with its own random stream.
+        """
+        if self.N == 0:
+            # every walker stays at the origin
+            self.final_counts[:, 0] += n_walkers
+            self.walkers += n_walkers
+            return
+        # int8 steps, int32 positions and int64 squares per step and axis
+        per_walker = 13 * self.N * self.dim
+        block = max(1, memory_budget // max(workers, 1) // max(per_walker, 1))
+
+        def simulate(rng, count):
+            x_accum = np.zeros_like(self.x_accum)
+            x_squared_accum = np.zeros_like(self.x_squared_accum)
+            final_counts = np.zeros_like(self.final_counts)
+            done = 0
+            while done < count:
+                m = min(block, count - done)
+                if self.dim == 1:
+                    steps = np.where(rng.random((m, self.N)) < self.p, 1, -1).astype(np.int8)
+                    x = np.cumsum(steps, axis=1, dtype=np.int32)
+                    x_accum[1:] += x.sum(axis=0)
+                    x_squared_accum[1:] += np.square(x, dtype=np.int64).sum(axis=0)
+                    x = x[:, -1:]
+                else:
+                    direction = rng.integers(0, 2 * self.dim, size=(m, self.N))
+                    steps = np.zeros((m, self.N, self.dim), dtype=np.int8)
+                    np.put_along_axis(steps, (direction // 2)[..., None],
+                                      (1 - 2 * (direction % 2)).astype(np.int8)[..., None], axis=2)
+                    x = np.cumsum(steps, axis=1, dtype=np.int32)
+                    x_accum[1:] += x.sum(axis=0)
+                    x_squared_accum[1:] += np.square(x, dtype=np.int64).sum(axis=(0, 2))
+                    x = x[:, -1, :]
+                for d in range(self.dim):
+                    final_counts[d] += np.bincount(x[:, d] + self.N, minlength=2 * self.N + 1)
+                done += m
+            return x_accum, x_squared_accum, final_counts
+
+        for x_accum, x_squared_accum, final_counts in run_ensemble(self.rng, n_walkers, simulate, workers):
+            self.x_accum += x_accum
+            self.x_squared_accum += x_squared_accum
+            self.final_counts += final_counts
+        self.walkers += n_walkers
+
+    def final_distribution(self, n_walkers=None):
+        """
+        Exact binomial fast path for the 1D final-position distribution.
+
+        The number of right steps is Binomial(N, p), so x_N = 2k - N.
+
+        :param n_walkers: If given, sample this many final positions instead of
+                          returning the exact probabilities.
+        :return: Tuple (positions, probabilities or counts).
+        """
+        k = np.arange(self.N + 1)
+        positions = 2 * k - self.N
+        if n_walkers is None:
+            return positions, binom.pmf(k, self.N, self.p)
+        counts = np.bincount(self.rng.binomial(self.N, self.p, size=n_walkers),
+                             minlength=self.N + 1)
+        return positions, counts
@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+from Walker import Walker
 
 # ****************************************
 # Page Configuration and Title
@@ -14,33 +15,30 @@ st.write("This app simulates random walkers in one dimension.")
 # ****************************************
 st.sidebar.header("Simulation Parameters")
 p_right = st.sidebar.slider("Probability p of step to right", 0.0, 1.0, 0.5)
-n_steps = st.sidebar.number_input("Number of steps N", value=100, step=10)
+n_steps = st.sidebar.number_input("Number of steps N", value=100, step=10, min_value=1)
 n_trials = st.sidebar.number_input("Number of trials", value=1000, step=100)
+dim = st.sidebar.selectbox("Lattice dimension", [1, 2, 3])
+memory_mb = st.sidebar.number_input("Memory budget (MB)", value=64, step=16)
+exact_final = st.sidebar.checkbox("Exact binomial final distribution (1D)", value=False)
+seed = st.sidebar.number_input("Random seed (-1 for a fresh one)", value=-1, step=1)
+seed = None if seed < 0 else int(seed)
+workers = st.sidebar.number_input("Worker threads", value=1, step=1, min_value=1)
 
 # ****************************************
 # Simulation Logic
 # ****************************************
 if st.sidebar.button("Run Simulation"):
-    final_positions = []
-    x_accum = np.zeros(n_steps + 1)
-    x2_accum = np.zeros(n_steps + 1)
+    walker = Walker(n_steps, p_right, dim=dim, rng=seed)
+    walker.run(n_trials, memory_budget=memory_mb * 2**20, workers=workers)
 
-    for _ in range(n_trials):
-        position = 0
-        x_accum[0] += position
-        x2_accum[0] += position**2
-        for i in range(n_steps):
-            if np.random.rand() < p_right:
-                position += 1
-            else:
-                position -= 1
-            x_accum[i+1] += position
-            x2_accum[i+1] += position**2
-        final_positions.append(position)
-
-    x_avg = x_accum / n_trials
-    x2_avg = x2_accum / n_trials
-    variance = x2_avg - x_avg**2
+    # For dim > 1, <x> is the first coordinate and the variance is summed over the axes,
+    # <|r|^2> - |<r>|^2
+    r_avg = walker.x_accum / n_trials
+    x_avg = r_avg if dim == 1 else r_avg[:, 0]
+    x2_avg = walker.x_squared_accum / n_trials
+    variance = x2_avg - (r_avg**2 if dim == 1 else np.sum(r_avg**2, axis=1))
+    variance_label = "<x^2> - <x>^2" if dim == 1 else "<r^2> - |<r>|^2"
+    positions = np.arange(-n_steps, n_steps + 1)
 
     # ****************************************
     # Display Results
@@ -50,7 +48,7 @@ if st.sidebar.button("Run Simulation"):
         st.subheader("Averages")
         fig1, ax1 = plt.subplots()
         ax1.plot(range(n_steps + 1), x_avg, label="<x>")
-        ax1.plot(range(n_steps + 1), variance, label="<x^2> - <x>^2")
+        ax1.plot(range(n_steps + 1), variance, label=variance_label)
         ax1.set_xlabel("Time")
         ax1.set_ylabel("Value")
         ax1.legend()
@@ -59,7 +57,11 @@ if st.sidebar.button("Run Simulation"):
     with col2:
         st.subheader("Final Position Distribution")
         fig2, ax2 = plt.subplots()
-        ax2.hist(final_positions, bins=20, density=True)
+        if dim == 1 and exact_final:
+            x_final, prob = walker.final_distribution()
+            ax2.bar(x_final, prob / 2, width=2)
+        else:
+            ax2.hist(positions, bins=20, weights=walker.final_counts[0], density=True)
         ax2.set_xlabel("Final Position")
         ax2.set_ylabel("Probability")
         st.pyplot(fig2)
@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+from Box import Box
+
+def final_counts(N, k, replicas, particles, jump=None):
+    counts = np.zeros(N + 1)
+    box = Box(N, particles=particles, rng=1)
+    for _ in range(replicas):
+        box.initialize()
+        if particles:
+            box.run(k)
+        else:
+            box.run_occupancy(k, jump=jump)
+        counts[box.nleft] += 1
+    return counts / replicas
+
+class OccupancyChainTest(unittest.TestCase):
+    def test_exact_moves_match_particle_moves(self):
+        # from nleft = 4 three moves give nleft = 1 with probability 3/8 and 3 with 5/8
+        exact = np.array([0, 3 / 8, 0, 5 / 8, 0])
+        for particles in (True, False):
+            distribution = final_counts(4, 3, 4000, particles, jump=1)
+            np.testing.assert_allclose(distribution, exact, atol=0.03)
+
+    def test_exact_moves_step_by_one(self):
+        box = Box(10, particles=False, rng=1)
+        history = box.run_occupancy(200, jump=1, record=True)
+        steps = np.diff(np.concatenate([[10], history]))
+        self.assertTrue(np.all(np.abs(steps) == 1))
+
+    def test_continuous_time_mean_relaxation(self):
+        # E[nleft(t)] = N / 2 (1 + exp(-2 t / N)) for independent flips at rate 1 / N
+        N, t = 40, 15
+        distribution = final_counts(N, t, 4000, particles=False, jump=t)
+        mean = np.arange(N + 1) @ distribution
+        self.assertAlmostEqual(mean, N / 2 * (1 + np.exp(-2 * t / N)), delta=0.3)
+
+    def test_empty_box(self):
+        box = Box(0, particles=False, rng=1)
+        self.assertEqual(list(box.run_occupancy(5, record=True)), [0] * 5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import numpy as np
+from BufferedRandom import BufferedRandom
+
+class BufferedRandomTest(unittest.TestCase):
+    def test_scalar_draws_follow_the_generator_stream(self):
+        buffered = BufferedRandom(42, block=16)
+        reference = np.random.default_rng(42)
+        draws = [buffered.random() for _ in range(40)]
+        # three refills of 16 values each, taken in order from the same stream
+        np.testing.assert_array_equal(draws, reference.random(48)[:40])
+
+    def test_each_kind_keeps_its_own_buffer(self):
+        buffered = BufferedRandom(3, block=8)
+        reference = np.random.default_rng(3)
+        uniform = reference.random(8)
+        normal = reference.standard_normal(8)
+        dice = reference.integers(0, 6, 8)
+        self.assertEqual(buffered.random(), uniform[0])
+        self.assertEqual(buffered.standard_normal(), normal[0])
+        self.assertEqual(buffered.integers(0, 6), dice[0])
+        self.assertEqual(buffered.random(), uniform[1])
+        self.assertEqual(buffered.integers(0, 6), dice[1])
+
+    def test_scalar_draws_have_the_right_distribution(self):
+        buffered = BufferedRandom(7, block=1000)
+        uniform = np.array([buffered.random() for _ in range(20000)])
+        normal = np.array([buffered.standard_normal() for _ in range(20000)])
+        dice = np.array([buffered.integers(1, 7) for _ in range(20000)])
+        self.assertAlmostEqual(uniform.mean(), 0.5, delta=0.01)
+        self.assertAlmostEqual(uniform.var(), 1 / 12, delta=0.005)
+        self.assertAlmostEqual(normal.mean(), 0.0, delta=0.03)
+        self.assertAlmostEqual(normal.std(), 1.0, delta=0.03)
+        self.assertEqual(set(dice), set(range(1, 7)))
+        np.testing.assert_allclose(np.bincount(dice)[1:] / dice.size, 1 / 6, atol=0.01)
+
+    def test_integer_buffers_are_bounded(self):
+        buffered = BufferedRandom(1, block=4)
+        for high in range(1, 3 * BufferedRandom.INTEGER_RANGES):
+            self.assertLess(buffered.integers(0, high), high)
+        self.assertEqual(len(buffered._integers), BufferedRandom.INTEGER_RANGES)
+
+    def test_array_draws_and_other_methods_pass_through(self):
+        buffered = BufferedRandom(5)
+        reference = np.random.default_rng(5)
+        np.testing.assert_array_equal(buffered.random(10), reference.random(10))
+        np.testing.assert_array_equal(buffered.integers(0, 9, 10), reference.integers(0, 9, 10))
+        self.assertEqual(buffered.exponential(), reference.exponential())
+        self.assertIs(BufferedRandom(buffered).generator, buffered.generator)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+import warnings
+import numpy as np
+from Fermat import Fermat
+
+class MinimizeTest(unittest.TestCase):
+    def test_newton_converges_to_snells_law(self):
+        for N in (2, 3, 50, 5000, 100000):
+            for dn in (0.001, 0.5, 5.0):
+                with self.subTest(N=N, dn=dn), warnings.catch_warnings():
+                    warnings.simplefilter("error")
+                    fermat = Fermat(N, dn, rng=1)
+                    start = fermat.total_time
+                    fermat.minimize()
+                    self.assertTrue(np.isfinite(fermat.total_time))
+                    self.assertLessEqual(fermat.total_time, start)
+                    self.assertAlmostEqual(fermat.total_time, fermat.compute_segment_times().sum(),
+                                           delta=1e-9 * fermat.total_time)
+                    # n sin(theta) is the same in every medium on the fastest path
+                    d = np.diff(fermat.y)
+                    invariant = d / np.sqrt(d**2 + 1) / fermat.v
+                    np.testing.assert_allclose(invariant, invariant[0], rtol=1e-5)
+
+    def test_minimize_agrees_with_annealing(self):
+        fermat = Fermat(6, 0.5, rng=2)
+        fermat.anneal(4000)
+        annealed = fermat.total_time
+        fermat.minimize()
+        self.assertAlmostEqual(fermat.total_time, annealed, delta=1e-4 * annealed)
+
+    def test_single_medium_is_left_alone(self):
+        fermat = Fermat(1, 0.5, rng=1)
+        fermat.minimize()
+        np.testing.assert_array_equal(fermat.y, [0.0, 1.0])
+
+if __name__ == "__main__":
+    unittest.main()
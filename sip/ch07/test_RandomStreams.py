@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+from RandomStreams import RandomStreams, run_ensemble, spawn
+from Walker import Walker
+from Nuclei import Nuclei
+from KineticMonteCarlo import KineticMonteCarlo, decay_network
+
+class RandomStreamsTest(unittest.TestCase):
+    def test_spawned_streams_are_reproducible_and_distinct(self):
+        first, second = (RandomStreams(7).spawn(2) for _ in range(2))
+        for a, b in zip(first, second):
+            self.assertEqual(a.random(), b.random())
+        self.assertNotEqual(first[0].random(), first[1].random())
+        self.assertEqual(spawn(7, 1)[0].random(), RandomStreams(7).generator().random())
+
+    def test_ensemble_groups_cover_every_member(self):
+        counts = run_ensemble(1, 10, lambda rng, count: count, workers=3)
+        self.assertEqual(counts, [4, 3, 3])
+        self.assertEqual(run_ensemble(1, 2, lambda rng, count: count, workers=5), [1, 1])
+
+    def test_seeded_runs_repeat_for_any_number_of_workers(self):
+        for workers in (1, 3):
+            runs = []
+            for _ in range(2):
+                walker = Walker(20, 0.5, dim=2, rng=3)
+                walker.run(500, workers=workers)
+                runs.append(walker.final_counts.copy())
+            np.testing.assert_array_equal(*runs)
+            self.assertEqual(runs[0][0].sum(), 500)
+
+    def test_threaded_ensembles_keep_their_statistics(self):
+        nuclei = Nuclei(20, 1000, 0.05, rng=5)
+        nuclei.run(200, workers=4)
+        np.testing.assert_allclose(nuclei.n / 200, 1000 * 0.95 ** np.arange(21), rtol=0.01)
+        kmc = KineticMonteCarlo(decay_network([0.05]), rng=5)
+        states = kmc.run([1000, 0], np.arange(21), replicas=200, workers=4)
+        self.assertEqual(len(states), 200)
+        np.testing.assert_allclose(KineticMonteCarlo.mean(states)[:, 0], 1000 * np.exp(-0.05 * np.arange(21)), rtol=0.01)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1 @@
+../../ch07/BufferedRandom.py
\ No newline at end of file
@@ -1,7 +1,7 @@
 import numpy as np
-import random
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle, Rectangle
+from BufferedRandom import BufferedRandom
 
 class PBC:
     @staticmethod
@@ -13,7 +13,8 @@ class PBC:
         return x - L * np.floor(x / L)
 
 class HardDisks:
-    def __init__(self, N, Lx, Ly):
+    def __init__(self, N, Lx, Ly, rng=None):
+        self.rng = BufferedRandom(rng)
         self.N = N
         self.Lx = Lx
         self.Ly = Ly
@@ -53,9 +54,10 @@ class HardDisks:
     def setVelocities(self):
         vxSum = 0
         vySum = 0
+        velocities = self.rng.random((self.N, 2)) - 0.5
         for i in range(self.N):
-            self.vx[i] = random.random() - 0.5
-            self.vy[i] = random.random() - 0.5
+            self.vx[i] = velocities[i, 0]
+            self.vy[i] = velocities[i, 1]
             vxSum += self.vx[i]
             vySum += self.vy[i]
         vxCM = vxSum / self.N
@@ -72,8 +74,9 @@ class HardDisks:
             overlap = True
             while overlap:
                 overlap = False
-                self.x[i] = self.Lx * random.random()
-                self.y[i] = self.Ly * random.random()
+                u, v = self.rng.random(), self.rng.random()
+                self.x[i] = self.Lx * u
+                self.y[i] = self.Ly * v
                 j = 0
                 while j < i and not overlap:
                     dx = PBC.separation(self.x[i] - self.x[j], self.Lx)
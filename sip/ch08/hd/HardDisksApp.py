@@ -11,10 +11,12 @@ N = st.sidebar.slider("Number of Particles (N)", 4, 100, 16)
 Lx = st.sidebar.slider("Box Width (Lx)", 4.0, 20.0, 8.0)
 Ly = st.sidebar.slider("Box Height (Ly)", 4.0, 20.0, 8.0)
 config = st.sidebar.selectbox("Initial Configuration", ["regular", "random"])
+seed = st.sidebar.number_input("Random seed (-1 for a fresh one)", value=-1, step=1)
+seed = None if seed < 0 else int(seed)
 
 # Initialize simulation
 if 'hd' not in st.session_state:
-    st.session_state.hd = HardDisks(N, Lx, Ly)
+    st.session_state.hd = HardDisks(N, Lx, Ly, rng=seed)
     st.session_state.hd.initialize(config)
 
 hd = st.session_state.hd
@@ -50,6 +52,6 @@ if st.sidebar.button("Run Simulation"):
             break
 
 if st.sidebar.button("Reset"):
-    st.session_state.hd = HardDisks(N, Lx, Ly)
+    st.session_state.hd = HardDisks(N, Lx, Ly, rng=seed)
     st.session_state.hd.initialize(config)
     st.rerun()
@@ -1,7 +1,7 @@
 import numpy as np
-import random
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle, Rectangle
+from BufferedRandom import BufferedRandom
 
 class Verlet:
     def __init__(self, ode, dt):
@@ -29,7 +29,8 @@ class Verlet:
             state[i] += self.dt * rate[i]
 
 class LJParticles:
-    def __init__(self, nx, ny, Lx, Ly, initialKineticEnergy, dt, initialConfiguration):
+    def __init__(self, nx, ny, Lx, Ly, initialKineticEnergy, dt, initialConfiguration, rng=None):
+        self.rng = BufferedRandom(rng)
         self.nx = nx
         self.ny = ny
         self.N = nx * ny
@@ -71,8 +72,9 @@ class LJParticles:
             overlap = True
             while overlap:
                 overlap = False
-                self.state[4*i] = self.Lx * random.random()
-                self.state[4*i+2] = self.Ly * random.random()
+                u, v = self.rng.random(), self.rng.random()
+                self.state[4*i] = self.Lx * u
+                self.state[4*i+2] = self.Ly * v
                 j = 0
                 while j < i and not overlap:
                     dx = self.pbcSeparation(self.state[4*i] - self.state[4*j], self.Lx)
@@ -105,9 +107,10 @@ class LJParticles:
     def setVelocities(self):
         vxSum = 0.0
         vySum = 0.0
+        velocities = self.rng.random((self.N, 2)) - 0.5
         for i in range(self.N):
-            self.state[4*i+1] = random.random() - 0.5
-            self.state[4*i+3] = random.random() - 0.5
+            self.state[4*i+1] = velocities[i, 0]
+            self.state[4*i+3] = velocities[i, 1]
             vxSum += self.state[4*i+1]
             vySum += self.state[4*i+3]
         
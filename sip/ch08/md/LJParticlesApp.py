@@ -14,10 +14,12 @@ Lx = st.sidebar.slider("Box Width (Lx)", 10.0, 50.0, 20.0)
 Ly = st.sidebar.slider("Box Height (Ly)", 10.0, 50.0, 15.0)
 dt = st.sidebar.slider("Time step (dt)", 0.001, 0.1, 0.01)
 config = st.sidebar.selectbox("Initial Configuration", ["rectangular", "triangular", "random"])
+seed = st.sidebar.number_input("Random seed (-1 for a fresh one)", value=-1, step=1)
+seed = None if seed < 0 else int(seed)
 
 # Initialize simulation
 if 'md' not in st.session_state:
-    st.session_state.md = LJParticles(nx, ny, Lx, Ly, initial_ke, dt, config)
+    st.session_state.md = LJParticles(nx, ny, Lx, Ly, initial_ke, dt, config, rng=seed)
     st.session_state.md.initialize()
 
 md = st.session_state.md
@@ -70,6 +72,6 @@ if st.sidebar.button("Run Simulation"):
             break
 
 if st.sidebar.button("Reset"):
-    st.session_state.md = LJParticles(nx, ny, Lx, Ly, initial_ke, dt, config)
+    st.session_state.md = LJParticles(nx, ny, Lx, Ly, initial_ke, dt, config, rng=seed)
     st.session_state.md.initialize()
     st.rerun()
@@ -17,6 +17,9 @@ class Analyze:
         self.N = N
         self.period = N * delta
         self.omega0 = 2 * np.pi / self.period
+        self.t = np.arange(N) * delta
+        self.samples = np.broadcast_to(np.asarray(f(self.t), dtype=float), self.t.shape)
+        self._spectrum = None
 
     def get_sine_coefficient(self, n):
         """
@@ -25,8 +28,7 @@ class Analyze:
         :param n: The coefficient index.
         :return: The coefficient.
         """
-        t = np.arange(0, self.period, self.delta)
-        sum_val = np.sum(self.f(t) * np.sin(n * self.omega0 * t))
+        sum_val = np.sum(self.samples * np.sin(n * self.omega0 * self.t))
         return 2 * self.delta * sum_val / self.period
 
     def get_cosine_coefficient(self, n):
@@ -36,6 +38,22 @@ class Analyze:
         :param n: The coefficient index.
         :return: The coefficient.
         """
-        t = np.arange(0, self.period, self.delta)
-        sum_val = np.sum(self.f(t) * np.cos(n * self.omega0 * t))
+        sum_val = np.sum(self.samples * np.cos(n * self.omega0 * self.t))
         return 2 * self.delta * sum_val / self.period
+
+    def coefficients(self, kmax):
+        """
+        Gets all cosine and sine coefficients for n = 0..kmax from one real FFT of the
+        cached samples, scaled like get_cosine_coefficient and get_sine_coefficient.
+        Indices beyond N/2 are aliased back as the sampled sums are.
+
+        :param kmax: The largest coefficient index.
+        :return: Tuple (cosine coefficients, sine coefficients), each of length kmax + 1.
+        """
+        if self._spectrum is None:
+            self._spectrum = np.fft.rfft(self.samples)
+        n = np.arange(kmax + 1) % self.N
+        mirrored = n > self.N // 2
+        spectrum = self._spectrum[np.where(mirrored, self.N - n, n)]
+        spectrum = np.where(mirrored, np.conj(spectrum), spectrum)
+        return 2.0 / self.N * spectrum.real, -2.0 / self.N * spectrum.imag
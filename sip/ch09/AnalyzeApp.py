@@ -2,6 +2,9 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from Analyze import Analyze
+from Expression import compile_expression, evaluate_grid
+from Spectrogram import Spectrogram, function_chunks
 
 st.set_page_config(layout="centered")
 st.title("Fourier Analysis App")
@@ -15,59 +18,30 @@ delta = st.sidebar.number_input("delta", 0.01, 1.0, 0.1, 0.01)
 N = st.sidebar.number_input("N (Number of samples)", 10, 1000, 200, 10)
 num_coeffs = st.sidebar.number_input("Number of coefficients", 1, 100, 10, 1)
 
-# ****************************************
-# [Analyze Class]
-# ****************************************
-class Analyze:
-    def __init__(self, f_str, N, delta):
-        self.t = np.arange(N) * delta
-        self.N = N
-        
-        # Safe evaluation context
-        safe_dict = {
-            "t": self.t,
-            "np": np,
-            "sin": np.sin,
-            "cos": np.cos,
-            "tan": np.tan,
-            "pi": np.pi,
-            "exp": np.exp,
-            "sqrt": np.sqrt,
-        }
-        try:
-            # Replace pi for numpy compatibility and evaluate
-            f_str_np = f_str.replace("pi", "np.pi")
-            self.y = eval(f_str_np, {"__builtins__": {}}, safe_dict)
-        except Exception as e:
-            st.error(f"Error parsing function string: '{f_str}'. Please check the syntax. Allowed variables: 't'. Allowed functions: sin, cos, tan, exp, sqrt, pi.")
-            st.stop()
-
-    def get_cosine_coefficient(self, k):
-        if k == 0:
-            return np.sum(self.y) / self.N
-        return (2.0 / self.N) * np.sum(self.y * np.cos(2 * np.pi * k * np.arange(self.N) / self.N))
-
-    def get_sine_coefficient(self, k):
-        return (2.0 / self.N) * np.sum(self.y * np.sin(2 * np.pi * k * np.arange(self.N) / self.N))
+st.sidebar.header("Spectrogram")
+show_spectrogram = st.sidebar.checkbox("Streaming spectrogram", value=False)
+n_stream = st.sidebar.number_input("Samples to stream", 1000, 10000000, 100000, 1000)
+window_length = st.sidebar.number_input("Window length", 16, 8192, 256, 16)
+hop = st.sidebar.number_input("Hop", 1, 8192, 64, 1)
+window = st.sidebar.selectbox("Window", ["hann", "hamming", "blackman", "boxcar"])
 
 # ****************************************
 # [Calculation]
 # ****************************************
-analyzer = Analyze(f_str, int(N), delta)
+# The formula is compiled once and its samples are cached per (formula, grid)
+t_axis = (("t", 0.0, N * delta, int(N), False),)
+try:
+    samples = evaluate_grid(f_str, t_axis)
+except Exception as e:
+    st.error(f"Error parsing function string: '{f_str}'. {e}")
+    st.stop()
+analyzer = Analyze(lambda t: samples, int(N), delta)
 f0 = 1.0 / (N * delta)
 
-frequencies = []
-cos_coeffs = []
-sin_coeffs = []
-
-for i in range(int(num_coeffs) + 1):
-    freq = i * f0
-    cos_c = analyzer.get_cosine_coefficient(i)
-    sin_c = analyzer.get_sine_coefficient(i)
-    
-    frequencies.append(freq)
-    cos_coeffs.append(cos_c)
-    sin_coeffs.append(sin_c)
+# All coefficients from a single real FFT; the constant term is shown as the mean
+frequencies = np.arange(int(num_coeffs) + 1) * f0
+cos_coeffs, sin_coeffs = analyzer.coefficients(int(num_coeffs))
+cos_coeffs[0] /= 2
 
 df = pd.DataFrame({
     "Frequency": frequencies,
@@ -107,3 +81,25 @@ st.pyplot(fig)
 # ****************************************
 st.subheader("Data Table")
 st.dataframe(df.style.format("{:.4f}"))
+
+# ****************************************
+# [Streaming Spectrogram]
+# ****************************************
+if show_spectrogram:
+    # f(t) is generated chunk by chunk; only the spectrogram is held in memory
+    f = compile_expression(f_str, ("t",))
+    spectrogram = Spectrogram(delta, int(window_length), int(hop), window)
+    spectrogram.consume(function_chunks(lambda t: f(t=t), delta, int(n_stream)))
+
+    st.subheader("Spectrogram")
+    if spectrogram.n_frames == 0:
+        st.warning("Stream at least one window of samples.")
+    else:
+        fig2, ax2 = plt.subplots()
+        power_db = 10 * np.log10(spectrogram.power.T + 1e-12)
+        im = ax2.pcolormesh(spectrogram.times, spectrogram.frequencies, power_db,
+                            shading='nearest', vmin=power_db.max() - 80)
+        ax2.set_xlabel("t")
+        ax2.set_ylabel("Frequency")
+        fig2.colorbar(im, ax=ax2, label="Squared amplitude (dB)")
+        st.pyplot(fig2)
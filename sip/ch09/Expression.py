@@ -0,0 +1,137 @@
+import ast
+from functools import lru_cache
+from types import SimpleNamespace
+import numpy as np
+
+# ****************************************
+# Whitelist
+# ****************************************
+FUNCTIONS = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "arcsin": np.arcsin, "arccos": np.arccos, "arctan": np.arctan, "arctan2": np.arctan2,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "exp": np.exp, "log": np.log, "log10": np.log10, "sqrt": np.sqrt,
+    "abs": np.abs, "sign": np.sign, "floor": np.floor, "ceil": np.ceil,
+    "heaviside": np.heaviside, "where": np.where, "minimum": np.minimum, "maximum": np.maximum,
+}
+CONSTANTS = {"pi": np.pi, "e": np.e}
+
+_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Attribute,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv, ast.USub, ast.UAdd,
+    ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq,
+)
+# "np.sin(x)" and "np.pi" keep working, but np only exposes the whitelist
+_NAMESPACE = {"__builtins__": {}, **FUNCTIONS, **CONSTANTS,
+              "np": SimpleNamespace(**FUNCTIONS, **CONSTANTS)}
+
+class ExpressionError(ValueError):
+    """
+    Raised for formulas that do not parse, use names outside the whitelist or overflow.
+    """
+
+class _FloatConstants(ast.NodeTransformer):
+    """
+    Turns integer constants into floats, so that constant subexpressions such as
+    9**9**9 overflow at once instead of building arbitrarily large Python integers.
+    """
+    def visit_Constant(self, node):
+        if type(node.value) is int:
+            return ast.copy_location(ast.Constant(float(node.value)), node)
+        return node
+
+# ****************************************
+# Expression Class
+# ****************************************
+class Expression:
+    """
+    A user-entered formula, parsed once into a validated AST and compiled to a reusable
+    code object.
+    """
+    def __init__(self, source, variables):
+        """
+        :param source: The formula text, e.g. "sin(pi*t/10)".
+        :param variables: Names the formula may use as variables.
+        """
+        self.source = source
+        self.variables = tuple(variables)
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ExpressionError(f"Invalid syntax in '{source}': {e.msg}") from None
+        self._validate(tree)
+        tree = ast.fix_missing_locations(_FloatConstants().visit(tree))
+        self.code = compile(tree, "<expression>", "eval")
+
+    def _validate(self, tree):
+        """
+        Rejects any node, name or attribute outside the whitelist.
+        """
+        allowed_names = set(self.variables) | set(FUNCTIONS) | set(CONSTANTS) | {"np"}
+        for node in ast.walk(tree):
+            if not isinstance(node, _NODES):
+                raise ExpressionError(f"'{type(node).__name__}' is not allowed in '{self.source}'.")
+            if isinstance(node, ast.Name) and node.id not in allowed_names:
+                raise ExpressionError(f"Unknown name '{node.id}' in '{self.source}'. "
+                                      f"Variables: {', '.join(self.variables)}. "
+                                      f"Functions: {', '.join(sorted(FUNCTIONS))}.")
+            if isinstance(node, ast.Attribute):
+                if not (isinstance(node.value, ast.Name) and node.value.id == "np"
+                        and (node.attr in FUNCTIONS or node.attr in CONSTANTS)):
+                    raise ExpressionError(f"Attribute access is limited to np.<function> in '{self.source}'.")
+            if isinstance(node, ast.Call):
+                function = node.func.attr if isinstance(node.func, ast.Attribute) else getattr(node.func, "id", None)
+                if function not in FUNCTIONS:
+                    raise ExpressionError(f"Only the whitelisted functions can be called in '{self.source}'. "
+                                          f"Functions: {', '.join(sorted(FUNCTIONS))}.")
+                if node.keywords:
+                    raise ExpressionError(f"Keyword arguments are not allowed in '{self.source}'.")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float, complex)):
+                raise ExpressionError(f"Only numeric constants are allowed in '{self.source}'.")
+
+    def __call__(self, **values):
+        """
+        Evaluates the compiled formula with the given variable values. Singular points
+        evaluate to inf or nan instead of raising; an overflow in scalar arithmetic
+        raises ExpressionError.
+        """
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            try:
+                return eval(self.code, _NAMESPACE, values)
+            except OverflowError as e:
+                raise ExpressionError(f"Overflow evaluating '{self.source}': {e}.") from None
+
+# ****************************************
+# Caches
+# ****************************************
+@lru_cache(maxsize=128)
+def compile_expression(source, variables=()):
+    """
+    Returns the compiled Expression for source, memoized by source text and variables.
+    """
+    return Expression(source, variables)
+
+@lru_cache(maxsize=32)
+def evaluate_grid(source, axes, derived=()):
+    """
+    Evaluates a formula on a tensor-product grid, memoized with LRU eviction by the
+    formula and the grid specification.
+
+    :param source: The formula text.
+    :param axes: Tuple of (name, start, stop, num, endpoint) per axis; the axes are
+                 combined with np.meshgrid, so for (x, y) the result has shape (ny, nx).
+    :param derived: Tuple of (name, source) pairs evaluated in order and made available
+                    to the formula, e.g. (("r_squared", "x**2 + y**2"),).
+    :return: A read-only array of the grid values.
+    """
+    names = [axis[0] for axis in axes]
+    coordinates = [np.linspace(start, stop, int(num), endpoint=endpoint)
+                   for _, start, stop, num, endpoint in axes]
+    values = dict(zip(names, np.meshgrid(*coordinates)))
+    for name, derived_source in derived:
+        values[name] = compile_expression(derived_source, tuple(values))(**values)
+    shape = values[names[0]].shape
+    result = np.array(np.broadcast_to(compile_expression(source, tuple(values))(**values), shape))
+    result.setflags(write=False)
+    return result
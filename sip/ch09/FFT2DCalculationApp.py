@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+import FFTBackend
 
 st.set_page_config(layout="wide")
 st.title("2D FFT Calculation App")
@@ -21,9 +22,7 @@ ymin, ymax = 0, 2 * np.pi
 # ****************************************
 # [Signal Generation]
 # ****************************************
-x = np.linspace(xmin, xmax, nx, endpoint=False)
-y = np.linspace(ymin, ymax, ny, endpoint=False)
-xx, yy = np.meshgrid(x, y)
+xx, yy = FFTBackend.meshgrid(xmin, xmax, nx, ymin, ymax, ny, endpoint=False)
 
 # Generate the complex signal: z = exp(i*x_mode*x) * exp(i*y_mode*y)
 z_data = np.exp(1j * x_mode * xx) * np.exp(1j * y_mode * yy)
@@ -32,7 +31,7 @@ z_data = np.exp(1j * x_mode * xx) * np.exp(1j * y_mode * yy)
 # [FFT Calculation]
 # ****************************************
 # Perform 2D FFT and shift the zero-frequency component to the center
-fft_result = np.fft.fftshift(np.fft.fft2(z_data))
+fft_result = np.fft.fftshift(FFTBackend.fft2(z_data))
 fft_magnitude = np.abs(fft_result)
 
 # ****************************************
@@ -2,6 +2,7 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import FFTBackend
 
 st.set_page_config(layout="wide")
 st.title("1D FFT of a Complex Exponential")
@@ -25,7 +26,7 @@ z = np.exp(1j * mode * x)
 # [FFT Calculation]
 # ****************************************
 # Perform the 1D FFT
-fft_z = np.fft.fft(z)
+fft_z = FFTBackend.fft(z)
 
 # ****************************************
 # [Display Results]
@@ -0,0 +1,169 @@
+from functools import lru_cache
+import numpy as np
+import scipy.fft
+import scipy.signal
+
+# ****************************************
+# Settings
+# ****************************************
+WORKERS = -1  # scipy.fft worker threads; -1 uses all cores
+
+def _dtypes(single):
+    return (np.float32, np.complex64) if single else (np.float64, np.complex128)
+
+# ****************************************
+# Transforms
+# ****************************************
+def fft(x, single=False, workers=WORKERS):
+    """
+    1D complex FFT of x, optionally in complex64.
+    """
+    return scipy.fft.fft(np.asarray(x, dtype=_dtypes(single)[1]), workers=workers)
+
+def ifft(x, single=False, workers=WORKERS):
+    """
+    1D inverse complex FFT of x, optionally in complex64.
+    """
+    return scipy.fft.ifft(np.asarray(x, dtype=_dtypes(single)[1]), workers=workers)
+
+def fft2(x, single=False, workers=WORKERS):
+    """
+    2D complex FFT of x, optionally in complex64.
+    """
+    return scipy.fft.fft2(np.asarray(x, dtype=_dtypes(single)[1]), workers=workers)
+
+def ifft2(x, single=False, workers=WORKERS, overwrite_x=False):
+    """
+    2D inverse complex FFT of x, optionally in complex64.
+    """
+    return scipy.fft.ifft2(np.asarray(x, dtype=_dtypes(single)[1]), workers=workers,
+                           overwrite_x=overwrite_x)
+
+def rfft(x, single=False, workers=WORKERS):
+    """
+    1D FFT of real x, returning the n // 2 + 1 non-negative frequencies.
+    """
+    return scipy.fft.rfft(np.asarray(x, dtype=_dtypes(single)[0]), workers=workers)
+
+def rfft2(x, single=False, workers=WORKERS):
+    """
+    2D FFT of real x, returning the nx // 2 + 1 non-negative x frequencies.
+    """
+    return scipy.fft.rfft2(np.asarray(x, dtype=_dtypes(single)[0]), workers=workers)
+
+# ****************************************
+# Power Spectra of Real Inputs
+# ****************************************
+def power_spectrum(x, shift=True, single=False, workers=WORKERS):
+    """
+    |FFT(x)|^2 over all n frequencies for real x, computed with a real FFT and
+    completed by the Hermitian symmetry |F(-k)| = |F(k)|.
+
+    :param shift: If True, put the zero frequency at the center like np.fft.fftshift.
+    """
+    half = rfft(x, single, workers)
+    half = half.real**2 + half.imag**2
+    n = len(x)
+    full = np.concatenate([half, half[1:n - n // 2][::-1]])
+    return np.fft.fftshift(full) if shift else full
+
+def power_spectrum2(x, shift=True, single=False, workers=WORKERS, out=None):
+    """
+    |FFT2(x)|^2 over the full frequency plane for real 2D x, computed with rfft2 and
+    completed by the Hermitian symmetry F(-k) = conj(F(k)).
+
+    :param shift: If True, put the zero frequency at the center like np.fft.fftshift.
+    :param out: Optional preallocated output array of x's shape, owned by the caller.
+    """
+    ny, nx = x.shape
+    half = rfft2(x, single, workers)
+    half = half.real**2 + half.imag**2
+    if out is None:
+        out = np.empty((ny, nx), dtype=half.dtype)
+    m = nx // 2 + 1
+    # the shift is applied while scattering, by moving index i to (i + n // 2) % n
+    rows = (np.arange(ny) + ny // 2) % ny if shift else np.arange(ny)
+    columns = (np.arange(nx) + nx // 2) % nx if shift else np.arange(nx)
+    out[np.ix_(rows, columns[:m])] = half
+    mirror_rows = (-np.arange(ny)) % ny
+    out[np.ix_(rows, columns[m:])] = half[np.ix_(mirror_rows, nx - np.arange(m, nx))]
+    return out
+
+# ****************************************
+# Zoom Transforms
+# ****************************************
+@lru_cache(maxsize=16)
+def _zoom_plan(n, f_min, f_max, m, fs):
+    return scipy.signal.ZoomFFT(n, [f_min, f_max], m, fs=fs, endpoint=True)
+
+def zoom_fft(x, f_range, m, d=1.0, axis=-1):
+    """
+    DFT of x along axis evaluated on m equally spaced frequencies spanning f_range,
+    in the cycles-per-unit convention of fftfreq(n, d), using the chirp-z transform.
+    Costs O((n + m) log(n + m)) per line however fine the frequency window is.
+    The chirp plans are cached per (n, f_range, m, d).
+    """
+    x = np.asarray(x)
+    return _zoom_plan(x.shape[axis], float(f_range[0]), float(f_range[1]), int(m), 1.0 / d)(x, axis=axis)
+
+def zoom_power_spectrum(x, f_range, m, d=1.0):
+    """
+    |DFT(x)|^2 on m frequencies spanning f_range; see zoom_fft.
+    """
+    spectrum = zoom_fft(x, f_range, m, d)
+    return spectrum.real**2 + spectrum.imag**2
+
+def zoom_power_spectrum2(x, fx_range, fy_range, mx, my, spacing=(1.0, 1.0), single=False):
+    """
+    |FFT2(x)|^2 on an my x mx frequency window, computed separably with one chirp-z
+    transform along x and one along y, so a small window at high resolution never
+    needs the full-plane transform at that resolution.
+
+    :param fx_range: (fx_min, fx_max) in the convention of fftfreq(nx, dx).
+    :param fy_range: (fy_min, fy_max) in the convention of fftfreq(ny, dy).
+    :param spacing: Sample spacing (dx, dy).
+    :param single: If True, return float32 intensities.
+    """
+    dx, dy = spacing
+    spectrum = zoom_fft(x, fx_range, mx, dx, axis=1)
+    spectrum = zoom_fft(spectrum, fy_range, my, dy, axis=0)
+    intensity = spectrum.real**2 + spectrum.imag**2
+    return intensity.astype(_dtypes(single)[0], copy=False)
+
+# ****************************************
+# Cached Grids
+# ****************************************
+def _read_only(a):
+    a.setflags(write=False)
+    return a
+
+@lru_cache(maxsize=32)
+def fftfreq(n, d=1.0, shift=False, angular=False):
+    """
+    Cached, read-only np.fft.fftfreq(n, d), optionally shifted and/or times 2 pi.
+    """
+    f = np.fft.fftfreq(n, d)
+    if angular:
+        f = 2 * np.pi * f
+    return _read_only(np.fft.fftshift(f) if shift else f)
+
+@lru_cache(maxsize=16)
+def k_grids(shape, spacing, shift=False, angular=True):
+    """
+    Cached, read-only wavenumber meshgrids (kx, ky, kx^2 + ky^2) for an array of
+    shape (ny, nx) with sample spacing (dx, dy).
+    """
+    ny, nx = shape
+    dx, dy = spacing
+    kx, ky = np.meshgrid(fftfreq(nx, dx, shift, angular), fftfreq(ny, dy, shift, angular))
+    return _read_only(kx), _read_only(ky), _read_only(kx**2 + ky**2)
+
+@lru_cache(maxsize=16)
+def meshgrid(xmin, xmax, nx, ymin, ymax, ny, endpoint=True):
+    """
+    Cached, read-only spatial meshgrids (xx, yy).
+    """
+    x = np.linspace(xmin, xmax, nx, endpoint=endpoint)
+    y = np.linspace(ymin, ymax, ny, endpoint=endpoint)
+    xx, yy = np.meshgrid(x, y)
+    return _read_only(xx), _read_only(yy)
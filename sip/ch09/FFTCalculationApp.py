@@ -2,6 +2,8 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import FFTBackend
+from Expression import compile_expression
 
 st.set_page_config(layout="wide")
 st.title("FFT Calculation with Variable Domain")
@@ -17,9 +19,8 @@ xmax_str = st.sidebar.text_input("x max", "2*pi")
 
 # Safely evaluate xmax_str
 try:
-    # Allow numpy functions in the eval context
-    safe_dict = {"pi": np.pi, "np": np}
-    xmax = eval(xmax_str, {"__builtins__": {}}, safe_dict)
+    # Whitelisted constant expression, compiled once per text
+    xmax = float(compile_expression(xmax_str)())
 except Exception as e:
     st.sidebar.error(f"Invalid expression for x max: {e}")
     st.stop()
@@ -35,14 +36,13 @@ z = np.exp(1j * mode * x)
 # [FFT Calculation]
 # ****************************************
 # Perform the 1D FFT
-fft_z = np.fft.fft(z)
+fft_z = FFTBackend.fft(z)
 # Calculate the frequencies
 delta_x = (xmax - xmin) / N
-frequencies = np.fft.fftfreq(N, d=delta_x)
 
-# Shift the FFT result and frequencies for plotting
+# Shift the FFT result and frequencies for plotting; the frequency grid is cached
 fft_z_shifted = np.fft.fftshift(fft_z)
-frequencies_shifted = np.fft.fftshift(frequencies)
+frequencies_shifted = FFTBackend.fftfreq(N, delta_x, shift=True)
 
 # ****************************************
 # [Display Results]
@@ -1,6 +1,9 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+import os
+import FFTBackend
+import OutOfCoreFFT
 
 st.set_page_config(layout="wide")
 st.title("2D Fraunhofer Diffraction")
@@ -9,8 +12,13 @@ st.title("2D Fraunhofer Diffraction")
 # [UI Inputs]
 # ****************************************
 st.sidebar.header("Simulation Parameters")
-n = st.sidebar.select_slider("Grid size (n x n)", options=[64, 128, 256, 512], value=256)
+n = st.sidebar.select_slider("Grid size (n x n)", options=[64, 128, 256, 512, 4096, 8192, 16384, 32768],
+                            value=256)
+# Grids beyond this are transformed out of core through memory-mapped files
+out_of_core = n > 2048
+DISPLAY = 1024  # Central block of the pattern shown for out-of-core grids
 aperture_type = st.sidebar.selectbox("Aperture Type", ["Circular", "Rectangular", "Double Slit"])
+single_precision = st.sidebar.checkbox("Single precision FFT", value=False)
 
 # Aperture-specific parameters
 radius = 0.0
@@ -30,32 +38,82 @@ elif aperture_type == "Double Slit":
     slit_separation = st.sidebar.slider("Slit Separation", 0.1, 2.0, 0.5, 0.1)
     slit_height = st.sidebar.slider("Slit Height", 0.1, 2.0, 2.0, 0.1)
 
+# Zoom window: the chirp-z transform resolves a small k-window finely without a huge FFT
+st.sidebar.header("Zoom")
+zoom = st.sidebar.checkbox("Zoom into a k-window (chirp-z)", value=False, disabled=out_of_core)
+zoom = zoom and not out_of_core
+a = 10.0  # Aperture screen dimension
+k_nyquist = n / (4 * a)
+kx_center = st.sidebar.number_input("Window center k_x", -k_nyquist, k_nyquist, 0.0, 0.1, disabled=not zoom)
+ky_center = st.sidebar.number_input("Window center k_y", -k_nyquist, k_nyquist, 0.0, 0.1, disabled=not zoom)
+half_width = st.sidebar.number_input("Window half-width", 0.01, k_nyquist, 1.0, 0.1, disabled=not zoom)
+m = st.sidebar.select_slider("Window resolution (m x m)", options=[256, 512, 1024, 2048, 4096],
+                             value=1024, disabled=not zoom)
+
 # ****************************************
 # [Aperture Generation]
 # ****************************************
-a = 10.0  # Aperture screen dimension
-x = np.linspace(-a, a, n)
-y = np.linspace(-a, a, n)
-xx, yy = np.meshgrid(x, y)
+def aperture_mask(x, y):
+    """Returns the aperture on the grid spanned by row vector x and column vector y."""
+    x, y = np.broadcast_arrays(x, y)
+    if aperture_type == "Circular":
+        mask = x**2 + y**2 < radius**2
+    elif aperture_type == "Rectangular":
+        mask = (np.abs(x) < width / 2) & (np.abs(y) < height / 2)
+    else:
+        slit1 = (np.abs(x - slit_separation / 2) < slit_width / 2) & (np.abs(y) < slit_height / 2)
+        slit2 = (np.abs(x + slit_separation / 2) < slit_width / 2) & (np.abs(y) < slit_height / 2)
+        mask = slit1 | slit2
+    return mask.astype(float)
 
-aperture = np.zeros((n, n), dtype=complex)
-
-if aperture_type == "Circular":
-    r = np.sqrt(xx**2 + yy**2)
-    aperture[r < radius] = 1
-elif aperture_type == "Rectangular":
-    aperture[(np.abs(xx) < width / 2) & (np.abs(yy) < height / 2)] = 1
-elif aperture_type == "Double Slit":
-    slit1 = (np.abs(xx - slit_separation / 2) < slit_width / 2) & (np.abs(yy) < slit_height / 2)
-    slit2 = (np.abs(xx + slit_separation / 2) < slit_width / 2) & (np.abs(yy) < slit_height / 2)
-    aperture[slit1 | slit2] = 1
+coordinates = np.linspace(-a, a, n)
+if out_of_core:
+    # Rows are generated on demand; only a coarse copy is kept for display
+    display_coordinates = np.linspace(-a, a, 512)
+    aperture = aperture_mask(display_coordinates[None, :], display_coordinates[:, None])
+else:
+    aperture = aperture_mask(coordinates[None, :], coordinates[:, None])
 
 # ****************************************
 # [FFT and Intensity Calculation]
 # ****************************************
-# Perform 2D FFT and shift
-diffraction_pattern = np.fft.fftshift(np.fft.fft2(aperture))
-intensity = np.abs(diffraction_pattern)**2
+# The aperture is real: a real 2D FFT plus Hermitian symmetry gives the full, shifted pattern
+dtype = np.float32 if single_precision else np.float64
+if zoom:
+    # Separable chirp-z transforms along x then y evaluate only the requested window
+    kx_range = (kx_center - half_width, kx_center + half_width)
+    ky_range = (ky_center - half_width, ky_center + half_width)
+    intensity = FFTBackend.zoom_power_spectrum2(aperture, kx_range, ky_range, m, m,
+                                                (2*a/n, 2*a/n), single=single_precision)
+    extent = (*kx_range, *ky_range)
+elif out_of_core:
+    # Row FFTs, blocked transpose and column FFTs between memory-mapped files; the
+    # displayed block is kept per session so other widgets do not redo the transform
+    out_of_core_key = (n, aperture_type, radius, width, height, slit_width, slit_separation,
+                       slit_height, single_precision)
+    if st.session_state.get("out_of_core_key") != out_of_core_key:
+        rows = lambda r0, r1: aperture_mask(coordinates[None, :], coordinates[r0:r1, None])
+        spectrum = OutOfCoreFFT.fft2_memmap(rows, shape=(n, n), single=single_precision)
+        center = OutOfCoreFFT.centered_crop(spectrum, DISPLAY)
+        filename = spectrum.filename
+        del spectrum
+        os.remove(filename)
+        st.session_state.out_of_core_intensity = (center.real**2 + center.imag**2).astype(dtype, copy=False)
+        st.session_state.out_of_core_key = out_of_core_key
+    intensity = st.session_state.out_of_core_intensity
+    k = FFTBackend.fftfreq(n, 2*a/n, shift=True)[n//2 - DISPLAY//2:n//2 + DISPLAY//2]
+    extent = (k[0], k[-1], k[0], k[-1])
+    st.caption(f"Central {DISPLAY} x {DISPLAY} block of the {n} x {n} pattern, "
+               "computed out of core in temporary memory-mapped files.")
+else:
+    # The output array is reused across reruns of this session only
+    buffer = st.session_state.get("intensity_buffer")
+    if buffer is None or buffer.shape != (n, n) or buffer.dtype != dtype:
+        buffer = st.session_state.intensity_buffer = np.empty((n, n), dtype=dtype)
+    intensity = FFTBackend.power_spectrum2(aperture, single=single_precision, out=buffer)
+    # The spatial frequency coordinates
+    k = FFTBackend.fftfreq(n, 2*a/n, shift=True)
+    extent = (k[0], k[-1], k[0], k[-1])
 
 # Normalize and apply log scale for better visualization
 max_intensity = np.max(intensity)
@@ -81,9 +139,7 @@ with col1:
 with col2:
     st.subheader("Diffraction Pattern (Log Intensity)")
     fig2, ax2 = plt.subplots()
-    # The spatial frequency coordinates
-    k = np.fft.fftshift(np.fft.fftfreq(n, d=2*a/n))
-    im = ax2.imshow(intensity_log, extent=(k[0], k[-1], k[0], k[-1]), cmap='hot', vmin=np.min(intensity_log), vmax=np.max(intensity_log))
+    im = ax2.imshow(intensity_log, extent=extent, origin='lower', cmap='hot', vmin=np.min(intensity_log), vmax=np.max(intensity_log))
     ax2.set_title("Fraunhofer Diffraction")
     ax2.set_xlabel("k_x")
     ax2.set_ylabel("k_y")
@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+import FFTBackend
 
 def main():
     """
@@ -13,12 +14,14 @@ def main():
     slit_width = 0.4  # Width of the slit
     LOG10 = np.log(10)
     ALPHA = np.log(1.0e-3) / LOG10  # Cutoff value for log scale
+    ZOOM_WINDOW = (-1.0, 1.0)  # Spatial-frequency window for the zoomed pattern
+    ZOOM_POINTS = 4096  # Resolution of the zoomed pattern
 
     # ****************************************
     # Create Aperture Function
     # ****************************************
-    # Create a complex array to hold the aperture data
-    aperture_data = np.zeros(N, dtype=complex)
+    # The aperture is real, so a real FFT suffices
+    aperture_data = np.zeros(N)
     
     # Define the spatial coordinates
     x = np.linspace(-a, a, N, endpoint=False)
@@ -27,19 +30,10 @@ def main():
     aperture_data[np.abs(x) < slit_width] = 1.0
 
     # ****************************************
-    # Perform FFT
+    # Perform FFT and Calculate Intensity
     # ****************************************
-    # Compute the Fast Fourier Transform
-    fft_result = np.fft.fft(aperture_data)
-    
-    # Shift the zero-frequency component to the center of the spectrum
-    fft_shifted = np.fft.fftshift(fft_result)
-
-    # ****************************************
-    # Calculate Intensity
-    # ****************************************
-    # Intensity is the square of the magnitude of the complex FFT result
-    intensity = np.abs(fft_shifted)**2
+    # Intensity is the squared magnitude of the FFT, with the zero frequency centered
+    intensity = FFTBackend.power_spectrum(aperture_data, shift=True)
     max_intensity = np.max(intensity)
     
     # Avoid division by zero if max_intensity is zero
@@ -79,6 +73,20 @@ def main():
     ax2.get_xaxis().set_visible(False)
     ax2.get_yaxis().set_visible(False)
 
+    # ****************************************
+    # Zoomed Intensity (Chirp-z Transform)
+    # ****************************************
+    # Resolves the central lobes on ZOOM_POINTS frequencies without a ZOOM_POINTS-size FFT
+    k_zoom = np.linspace(*ZOOM_WINDOW, ZOOM_POINTS)
+    zoom_intensity = FFTBackend.zoom_power_spectrum(aperture_data, ZOOM_WINDOW, ZOOM_POINTS, 2 * a / N)
+
+    fig3, ax3 = plt.subplots()
+    ax3.plot(k_zoom, zoom_intensity / max_intensity)
+    ax3.set_title("Zoomed Fraunhofer Intensity")
+    ax3.set_xlabel("Spatial frequency")
+    ax3.set_ylabel("Intensity")
+    ax3.grid(True)
+
     plt.show()
 
 if __name__ == "__main__":
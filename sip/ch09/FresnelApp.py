@@ -1,6 +1,8 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+import FFTBackend
+from Propagation import AngularSpectrum
 
 st.set_page_config(layout="wide")
 st.title("2D Fresnel Diffraction")
@@ -12,56 +14,44 @@ st.sidebar.header("Simulation Parameters")
 N = st.sidebar.select_slider("Grid size (N x N)", options=[128, 256, 512], value=256)
 z = st.sidebar.slider("Distance to screen (z)", 1.0e5, 1.0e6, 0.5e6, 1.0e4)
 radius = st.sidebar.slider("Aperture Radius", 500.0, 5000.0, 2000.0, 100.0)
+single_precision = st.sidebar.checkbox("Single precision FFT", value=False)
+focus_stack = st.sidebar.checkbox("Precompute focus stack", value=False)
+n_planes = st.sidebar.slider("Planes in focus stack", 8, 128, 32, 8, disabled=not focus_stack)
 
 # ****************************************
 # [Aperture Generation]
 # ****************************************
 a = 6000.0  # Aperture mask dimension
-x = np.linspace(-a, a, N)
-y = np.linspace(-a, a, N)
-xx, yy = np.meshgrid(x, y)
+xx, yy = FFTBackend.meshgrid(-a, a, N, -a, a, N)
 
-aperture = np.zeros((N, N), dtype=complex)
+aperture = np.zeros((N, N))
 r2 = xx**2 + yy**2
 aperture[r2 < radius**2] = 1
 
 # ****************************************
-# [FFT and Propagation]
+# [Angular-Spectrum Propagation]
 # ****************************************
-# Step 1: FFT of the aperture
-fft_aperture = np.fft.fft2(aperture)
-
-# Step 2: Create the propagator in the frequency domain
-kx = np.fft.fftfreq(N, d=2*a/N) * 2 * np.pi
-ky = np.fft.fftfreq(N, d=2*a/N) * 2 * np.pi
-kx_grid, ky_grid = np.meshgrid(kx, ky)
-
-# Wavenumber squared
-k_squared = kx_grid**2 + ky_grid**2
-# Wavenumber of light (assuming lambda = 1 for simplicity, so k_light = 2*pi)
-k_light_squared = (2 * np.pi)**2
-
-radical = k_light_squared - k_squared
-propagator = np.zeros_like(k_squared, dtype=complex)
-
-# Propagating waves
-prop_waves = radical > 0
-propagator[prop_waves] = np.exp(1j * z * np.sqrt(radical[prop_waves]))
-
-# Evanescent waves
-evan_waves = radical <= 0
-propagator[evan_waves] = np.exp(-z * np.sqrt(-radical[evan_waves]))
-
-# Step 3: Multiply FFT of aperture by propagator
-fft_propagated = fft_aperture * propagator
-
-# Step 4: Inverse FFT to get the field at the screen
-field_at_screen = np.fft.ifft2(fft_propagated)
+# Aperture spectrum and factored propagator i*kz are cached (lambda = 1, so k_light = 2*pi);
+# a new z only costs exp(i*kz*z) and one inverse FFT
+engine = AngularSpectrum(aperture, (2*a/N, 2*a/N), wavelength=1.0, single=single_precision)
+
+if focus_stack:
+    # Propagate to every plane once with batched inverse FFTs, then scrub z for free
+    z_planes = np.linspace(1.0e5, 1.0e6, n_planes)
+    stack_key = (N, radius, single_precision, n_planes)
+    if st.session_state.get("stack_key") != stack_key:
+        st.session_state.stack = engine.intensity_stack(z_planes)
+        st.session_state.stack_key = stack_key
+    plane = int(np.argmin(np.abs(z_planes - z)))
+    z = z_planes[plane]
+    intensity = st.session_state.stack[plane]
+else:
+    field_at_screen = engine.field(z)
+    intensity = np.abs(field_at_screen)**2
 
 # ****************************************
 # [Intensity Calculation]
 # ****************************************
-intensity = np.abs(field_at_screen)**2
 max_intensity = np.max(intensity)
 if max_intensity > 0:
     intensity_normalized = intensity / max_intensity
@@ -21,36 +21,42 @@ if 'time' not in st.session_state:
 # [Calculation Logic with Caching]
 # ****************************************
 @st.cache_data
-def calculate_phasors(sources_df, n, a):
-    """Calculates the base real and imaginary phasors for a set of sources."""
+def calculate_phasors(sources_df, n, a, max_elements=2**22):
+    """
+    Calculates the base real and imaginary phasors for a set of sources as float32.
+    Sources are broadcast against the grid in chunks of at most max_elements values.
+    """
     if sources_df.empty:
-        return np.zeros((n, n)), np.zeros((n, n))
-
-    grid_points = np.linspace(-a / 2, a / 2, n)
-    xx, yy = np.meshgrid(grid_points, grid_points)
-    
-    total_real_phasor = np.zeros((n, n))
-    total_imag_phasor = np.zeros((n, n))
-
-    for _, source in sources_df.iterrows():
-        dx = xx - source['x']
-        dy = yy - source['y']
-        r = np.sqrt(dx**2 + dy**2)
-        
+        return np.zeros((n, n), dtype=np.float32), np.zeros((n, n), dtype=np.float32)
+
+    grid_points = np.linspace(-a / 2, a / 2, n, dtype=np.float32)
+    source_x = sources_df['x'].to_numpy(dtype=np.float32)
+    source_y = sources_df['y'].to_numpy(dtype=np.float32)
+
+    total_real_phasor = np.zeros((n, n), dtype=np.float32)
+    total_imag_phasor = np.zeros((n, n), dtype=np.float32)
+
+    chunk = max(1, max_elements // (n * n))
+    for start in range(0, len(source_x), chunk):
+        # r^2 = (x - x_s)^2 + (y - y_s)^2 is separable: build it from per-axis terms
+        dx2 = (grid_points[None, :] - source_x[start:start + chunk, None])**2
+        dy2 = (grid_points[None, :] - source_y[start:start + chunk, None])**2
+        r = np.sqrt(dy2[:, :, None] + dx2[:, None, :])
+
         # Avoid division by zero at the source location
         r[r == 0] = 1e-9
-        
+
         phase = 2 * np.pi * r
-        total_real_phasor += np.cos(phase) / r
-        total_imag_phasor += np.sin(phase) / r
-        
+        total_real_phasor += (np.cos(phase) / r).sum(axis=0)
+        total_imag_phasor += (np.sin(phase) / r).sum(axis=0)
+
     return total_real_phasor, total_imag_phasor
 
 # ****************************************
 # [UI Controls]
 # ****************************************
 st.sidebar.header("Controls")
-n = st.sidebar.select_slider("Grid Size (n x n)", options=[64, 128, 256], value=128)
+n = st.sidebar.select_slider("Grid Size (n x n)", options=[64, 128, 256, 512], value=128)
 a = st.sidebar.slider("Grid Length (a)", 5.0, 20.0, 10.0, 0.5)
 
 if st.sidebar.button("Add Source"):
@@ -79,38 +85,47 @@ time_placeholder = st.empty()
 # Get the base phasors (this will be cached)
 real_phasor, imag_phasor = calculate_phasors(st.session_state.sources, n, a)
 
+# Preallocated frame buffers and a single figure whose image artist is updated in place
+re_field = np.zeros((n, n), dtype=np.float32)
+rotated_imag = np.zeros((n, n), dtype=np.float32)
+
+fig, ax = plt.subplots()
+im = ax.imshow(re_field, extent=(-a/2, a/2, -a/2, a/2), cmap='hot', origin='lower')
+
+# Plot sources on top
+if not st.session_state.sources.empty:
+    ax.plot(st.session_state.sources['x'], st.session_state.sources['y'], 'bo', markersize=5)
+    # Set a reasonable color scale based on number of sources
+    im.set_clim(0, 0.2 * len(st.session_state.sources))
+
+ax.set_xlabel("x")
+ax.set_ylabel("y")
+ax.set_title("Interference Pattern")
+
 def draw_frame(t):
     """Draws a single frame of the animation for a given time t."""
     cos_t = np.cos(2 * np.pi * t)
     sin_t = np.sin(2 * np.pi * t)
-    
-    # Rotate the phasor: Re(phasor * e^(-i*omega*t))
-    re_field = cos_t * real_phasor + sin_t * imag_phasor
-    amplitude = re_field**2
-    
-    fig, ax = plt.subplots()
-    im = ax.imshow(amplitude, extent=(-a/2, a/2, -a/2, a/2), cmap='hot', origin='lower')
-    
-    # Plot sources on top
-    if not st.session_state.sources.empty:
-        ax.plot(st.session_state.sources['x'], st.session_state.sources['y'], 'bo', markersize=5)
-        # Set a reasonable color scale based on number of sources
-        im.set_clim(0, 0.2 * len(st.session_state.sources))
-
-    ax.set_xlabel("x")
-    ax.set_ylabel("y")
-    ax.set_title("Interference Pattern")
-    
+
+    # Rotate the phasor: Re(phasor * e^(-i*omega*t)), then square, all in place
+    np.multiply(real_phasor, cos_t, out=re_field)
+    np.multiply(imag_phasor, sin_t, out=rotated_imag)
+    np.add(re_field, rotated_imag, out=re_field)
+    np.square(re_field, out=re_field)
+
+    im.set_data(re_field)
     plot_placeholder.pyplot(fig)
     time_placeholder.write(f"Time: {t:.2f}")
-    plt.close(fig)
 
 # Animation loop
-if st.session_state.running:
-    while True:
-        st.session_state.time += 0.05
+try:
+    if st.session_state.running:
+        while True:
+            st.session_state.time += 0.05
+            draw_frame(st.session_state.time)
+            time.sleep(0.01) # Control frame rate
+    else:
+        # Draw a static frame if not running
         draw_frame(st.session_state.time)
-        time.sleep(0.01) # Control frame rate
-else:
-    # Draw a static frame if not running
-    draw_frame(st.session_state.time)
+finally:
+    plt.close(fig)
@@ -2,6 +2,8 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import time
+from Expression import evaluate_grid
+from NormalModes import NormalModes
 
 st.set_page_config(layout="centered")
 st.title("Coupled Oscillators Simulation")
@@ -10,24 +12,31 @@ st.title("Coupled Oscillators Simulation")
 # [Oscillators Class]
 # ****************************************
 class Oscillators:
-    def __init__(self, mode, N):
+    def __init__(self, mode, N, displacements=None, velocities=None):
+        """
+        Starts the chain in a single mode, or from arbitrary initial displacements and
+        velocities when displacements is given.
+        """
         self.N = N
         self.mode = mode
         self.time = 0.0
         self.positions = np.arange(1, N + 1)
-        
-        # Calculate angular frequency for the given mode
-        self.omega = 2 * np.sin(self.mode * np.pi / (2 * (self.N + 1)))
+
+        # All modes are projected with one DST and evolved analytically
+        if displacements is None:
+            self.modes = NormalModes.pure_mode(mode, N)
+        else:
+            self.modes = NormalModes(displacements, velocities)
+        self.omega = self.modes.omega[mode - 1]
+        self.y_limit = max(1.5, 1.5 * np.max(np.abs(self.get_displacements())))
 
     def step(self, dt):
         self.time += dt
 
     def get_displacements(self):
         """Calculates the displacement of each oscillator at the current time."""
-        # y_j(t) = sin(j * m * pi / (N + 1)) * cos(omega_m * t)
-        spatial_part = np.sin(self.positions * self.mode * np.pi / (self.N + 1))
-        temporal_part = np.cos(self.omega * self.time)
-        return spatial_part * temporal_part
+        # y_j(t) = sum_m sin(j * m * pi / (N + 1)) * (a_m cos(omega_m t) + b_m sin(omega_m t))
+        return self.modes.displacements(self.time)
 
 # ****************************************
 # [Session State Initialization]
@@ -44,11 +53,31 @@ st.sidebar.header("Simulation Parameters")
 N = st.sidebar.number_input("Number of particles (N)", 4, 100, 16, 1)
 mode = st.sidebar.number_input("Mode", 1, N, 1, 1)
 dt = st.sidebar.slider("Time step (dt)", 0.01, 1.0, 0.5, 0.01)
+initial = st.sidebar.selectbox("Initial condition", ["Single mode", "Custom"])
+# x = j / (N + 1) runs over the particles between the fixed ends at 0 and 1
+y0_str = st.sidebar.text_input("Initial displacement y(x)", "exp(-200*(x-0.3)**2)",
+                               disabled=initial != "Custom")
+v0_str = st.sidebar.text_input("Initial velocity v(x)", "0", disabled=initial != "Custom")
 
 if st.sidebar.button("Initialize/Reset"):
-    st.session_state.oscillators = Oscillators(mode=mode, N=N)
+    if initial == "Custom":
+        x_axis = (("x", 1 / (N + 1), N / (N + 1), N, True),)
+        try:
+            y0 = evaluate_grid(y0_str, x_axis)
+            v0 = evaluate_grid(v0_str, x_axis)
+        except Exception as e:
+            st.sidebar.error(f"Error evaluating initial condition: {e}")
+            st.stop()
+        st.session_state.oscillators = Oscillators(mode=mode, N=N, displacements=y0, velocities=v0)
+    else:
+        st.session_state.oscillators = Oscillators(mode=mode, N=N)
     st.session_state.running = False
 
+# The exact solution can be evaluated at any time without stepping through it
+jump_time = st.sidebar.number_input("Time", 0.0, None, 0.0, 1.0)
+if st.sidebar.button("Jump to Time"):
+    st.session_state.oscillators.time = jump_time
+
 if st.sidebar.button("Start/Stop"):
     st.session_state.running = not st.session_state.running
 
@@ -76,7 +105,7 @@ def draw_frame():
     ax.set_ylabel("Displacement")
     ax.set_title("Coupled Oscillators")
     ax.set_xlim(0, osc.N + 1)
-    ax.set_ylim(-1.5, 1.5)
+    ax.set_ylim(-osc.y_limit, osc.y_limit)
     ax.grid(True)
     
     plot_placeholder.pyplot(fig)
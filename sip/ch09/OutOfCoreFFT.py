@@ -0,0 +1,119 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import scipy.fft
+
+# ****************************************
+# Helpers
+# ****************************************
+def _stripes(n, size):
+    return [(start, min(start + size, n)) for start in range(0, n, size)]
+
+def _open(path, shape, dtype):
+    if path is None:
+        handle, path = tempfile.mkstemp(suffix=".npy")
+        os.close(handle)
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+class _RowSource:
+    """
+    Gives a rows(start, stop) callable the slicing interface used by _row_ffts.
+    """
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __getitem__(self, rows):
+        return self.rows(rows.start, rows.stop)
+
+def _transpose(source, target, tile, pool):
+    """
+    Copies source.T into target tile by tile, one stripe of source rows per task, so
+    each task reads contiguous rows and writes tile-sized runs of target rows.
+    """
+    rows, columns = source.shape
+
+    def copy(i0, i1):
+        stripe = np.asarray(source[i0:i1])
+        for j0, j1 in _stripes(columns, tile):
+            target[j0:j1, i0:i1] = stripe[:, j0:j1].T
+
+    list(pool.map(lambda stripe: copy(*stripe), _stripes(rows, tile)))
+
+def _row_ffts(source, target, stripe_rows, pool, inverse=False):
+    """
+    target[r] = FFT(source[r]) for every row, one stripe of rows per task.
+    """
+    transform = scipy.fft.ifft if inverse else scipy.fft.fft
+
+    def run(r0, r1):
+        # transform an in-memory copy, so the caller's array or r+ memmap is never written
+        stripe = np.array(source[r0:r1], dtype=target.dtype, copy=True)
+        target[r0:r1] = transform(stripe, axis=1, overwrite_x=True, workers=1)
+
+    list(pool.map(lambda stripe: run(*stripe), _stripes(target.shape[0], stripe_rows)))
+
+# ****************************************
+# Out-of-Core 2D FFT
+# ****************************************
+def fft2_memmap(source, shape=None, path=None, single=False, inverse=False,
+                memory_budget=2**28, threads=None, tile=512):
+    """
+    2D FFT of a grid too large for memory, computed between memory-mapped .npy files:
+    row FFTs into a scratch file, a blocked transpose, row FFTs of the transposed grid
+    (the original columns) and a blocked transpose back. Stripes of rows are processed
+    in parallel threads; scipy.fft and file I/O release the GIL.
+
+    :param source: 2D array or memmap of shape (ny, nx), or a callable rows(start, stop)
+                   returning rows start..stop-1, so the input never has to exist in full.
+    :param shape: (ny, nx); required when source is a callable.
+    :param path: .npy file for the result; a temporary file if None (see .filename),
+                 which the caller deletes. It is removed if the transform fails.
+    :param single: If True, store and transform complex64 instead of complex128.
+    :param inverse: If True, compute the inverse 2D FFT.
+    :param memory_budget: Approximate bytes of stripes held in memory at once.
+    :param threads: Number of worker threads; os.cpu_count() if None.
+    :param tile: Edge length of the square tiles used by the transposes.
+    :return: The transform as a numpy memmap of shape (ny, nx).
+    """
+    if callable(source):
+        rows = source
+    else:
+        shape = source.shape
+        rows = lambda r0, r1: source[r0:r1]
+    ny, nx = shape
+    dtype = np.dtype(np.complex64 if single else np.complex128)
+    threads = threads or os.cpu_count() or 1
+    stripe_rows = lambda n: max(1, memory_budget // (threads * n * dtype.itemsize))
+
+    result = _open(path, (ny, nx), dtype)
+    filename = result.filename
+    scratch_filename = os.path.join(os.path.dirname(filename), os.path.basename(filename) + ".T.npy")
+    scratch = None
+    try:
+        scratch = _open(scratch_filename, (nx, ny), dtype)
+        with ThreadPoolExecutor(threads) as pool:
+            _row_ffts(_RowSource(rows), result, stripe_rows(nx), pool, inverse)
+            _transpose(result, scratch, tile, pool)
+            _row_ffts(scratch, scratch, stripe_rows(ny), pool, inverse)
+            _transpose(scratch, result, tile, pool)
+        result.flush()
+    except BaseException:
+        if path is None:
+            del result
+            os.remove(filename)
+        raise
+    finally:
+        del scratch
+        if os.path.exists(scratch_filename):
+            os.remove(scratch_filename)
+    return result
+
+def centered_crop(spectrum, m):
+    """
+    Returns the m x m block of fftshift(spectrum) around zero frequency, read directly
+    from the (possibly memory-mapped) unshifted spectrum.
+    """
+    ny, nx = spectrum.shape
+    offsets = np.arange(-(m // 2), m - m // 2)
+    return np.asarray(spectrum[offsets % ny])[:, offsets % nx]
@@ -0,0 +1,112 @@
+import hashlib
+import os
+import tempfile
+import weakref
+import numpy as np
+import FFTBackend
+
+# ****************************************
+# Caches
+# ****************************************
+_spectrum_cache = {}
+_kernel_cache = {}
+_CACHE_SIZE = 4
+
+def _remember(cache, key, value):
+    cache[key] = value
+    while len(cache) > _CACHE_SIZE:
+        del cache[next(iter(cache))]
+    return value
+
+# ****************************************
+# AngularSpectrum Class
+# ****************************************
+class AngularSpectrum:
+    """
+    Angular-spectrum propagation of an aperture field to one or many distances z.
+
+    The aperture spectrum is cached per aperture and the propagator is kept in factored
+    form i*kz with kz = sqrt(k^2 - kx^2 - ky^2) (imaginary for evanescent waves), so a
+    new distance costs one elementwise exp(z * i*kz) and one inverse FFT.
+    """
+    def __init__(self, aperture, spacing, wavelength=1.0, single=False):
+        """
+        :param aperture: 2D aperture field of shape (ny, nx).
+        :param spacing: Sample spacing (dx, dy).
+        :param wavelength: Wavelength of the light.
+        :param single: If True, use complex64 transforms.
+        """
+        self.single = single
+        self.shape = aperture.shape
+        key = (hashlib.sha1(np.ascontiguousarray(aperture).tobytes()).hexdigest(),
+               aperture.shape, str(aperture.dtype), single)
+        self.spectrum = _spectrum_cache.get(key)
+        if self.spectrum is None:
+            self.spectrum = _remember(_spectrum_cache, key, FFTBackend.fft2(aperture, single=single))
+
+        # the phase z*kz reaches millions of radians, so the kernel stays complex128
+        kernel_key = (self.shape, tuple(spacing), wavelength)
+        self.ikz = _kernel_cache.get(kernel_key)
+        if self.ikz is None:
+            k_squared = FFTBackend.k_grids(self.shape, tuple(spacing))[2]
+            radical = (2 * np.pi / wavelength)**2 - k_squared
+            self.ikz = _remember(_kernel_cache, kernel_key, 1j * np.sqrt(radical.astype(complex)))
+
+    def propagator(self, z):
+        """
+        Returns exp(i kz z); evanescent components decay as exp(-|kz| z).
+        """
+        propagator = np.exp(z * self.ikz)
+        return propagator.astype(np.complex64) if self.single else propagator
+
+    def field(self, z):
+        """
+        Returns the complex field at distance z.
+        """
+        return FFTBackend.ifft2(self.spectrum * self.propagator(z), single=self.single,
+                                overwrite_x=True)
+
+    def intensity_stack(self, z_values, batch=8, memory_limit=2**30, path=None):
+        """
+        Returns the intensities |field(z)|^2 for every z, of shape (len(z), ny, nx),
+        computed with batched inverse FFTs over batch distances at a time.
+
+        :param z_values: Sequence of distances.
+        :param batch: Number of distances per batched inverse FFT.
+        :param memory_limit: Stacks larger than this many bytes are written to a
+                             memory-mapped .npy file instead of RAM.
+        :param path: Optional .npy file path for the memory map, owned by the caller. If
+                     the stack exceeds memory_limit and no path is given, a temporary
+                     file is used instead; it belongs to the returned memmap and is
+                     deleted once the memmap and every view of it are garbage collected.
+        :return: The stack as an ndarray or a numpy memmap.
+        """
+        z_values = np.asarray(z_values, dtype=float)
+        dtype = np.float32 if self.single else np.float64
+        shape = (len(z_values),) + self.shape
+        nbytes = np.prod(shape) * np.dtype(dtype).itemsize
+        temporary = path is None and nbytes > memory_limit
+        if temporary:
+            handle, path = tempfile.mkstemp(suffix=".npy")
+            os.close(handle)
+        try:
+            if path is not None:
+                stack = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+            else:
+                stack = np.empty(shape, dtype=dtype)
+
+            for start in range(0, len(z_values), batch):
+                z = z_values[start:start + batch]
+                spectra = self.spectrum[None] * self.propagator(z[:, None, None])
+                fields = FFTBackend.ifft2(spectra, single=self.single, overwrite_x=True)
+                stack[start:start + len(z)] = fields.real**2 + fields.imag**2
+            if isinstance(stack, np.memmap):
+                stack.flush()
+        except BaseException:
+            if temporary:
+                stack = None
+                os.remove(path)
+            raise
+        if temporary:
+            weakref.finalize(stack, os.remove, path)
+        return stack
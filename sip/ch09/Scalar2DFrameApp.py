@@ -1,6 +1,6 @@
 import streamlit as st
-import numpy as np
 import matplotlib.pyplot as plt
+from Expression import evaluate_grid
 
 st.set_page_config(layout="centered")
 st.title("2D Scalar Field Visualizer")
@@ -20,24 +20,9 @@ function_str = st.sidebar.text_input("Function f(x, y)", "x * y")
 # ****************************************
 # [Data Generation]
 # ****************************************
-x_vals = np.linspace(xmin, xmax, nx)
-y_vals = np.linspace(ymin, ymax, ny)
-x, y = np.meshgrid(x_vals, y_vals)
-
 try:
-    # Safe evaluation of the user-provided function string
-    safe_dict = {
-        'x': x,
-        'y': y,
-        'np': np,
-        'sin': np.sin,
-        'cos': np.cos,
-        'tan': np.tan,
-        'exp': np.exp,
-        'sqrt': np.sqrt,
-        'pi': np.pi
-    }
-    data = eval(function_str, {"__builtins__": {}}, safe_dict)
+    # Whitelisted formula, compiled once and cached per (formula, grid)
+    data = evaluate_grid(function_str, (("x", xmin, xmax, nx, True), ("y", ymin, ymax, ny, True)))
 except Exception as e:
     st.error(f"Error evaluating function: {e}")
     st.stop()
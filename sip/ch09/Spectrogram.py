@@ -0,0 +1,137 @@
+import numpy as np
+import scipy.fft
+import scipy.signal
+from numpy.lib.stride_tricks import sliding_window_view
+
+# ****************************************
+# Chunk Sources
+# ****************************************
+def function_chunks(f, delta, n_samples, chunk_size=4096):
+    """
+    Yields samples f(t) at t = k * delta for k = 0..n_samples - 1 in chunks.
+    """
+    for start in range(0, n_samples, chunk_size):
+        t = np.arange(start, min(start + chunk_size, n_samples)) * delta
+        yield np.broadcast_to(np.asarray(f(t), dtype=float), t.shape)
+
+def file_chunks(path, chunk_size=65536, dtype=float):
+    """
+    Yields a 1D signal stored in a .npy file, or as raw binary values of dtype, in
+    chunks read through a memory map.
+    """
+    if str(path).endswith(".npy"):
+        data = np.load(path, mmap_mode="r")
+    else:
+        data = np.memmap(path, dtype=dtype, mode="r")
+    for start in range(0, len(data), chunk_size):
+        yield np.array(data[start:start + chunk_size], dtype=float)
+
+def simulation_chunks(step, observable, n_samples, chunk_size=1024):
+    """
+    Yields an observable of a running simulation, such as a molecular-dynamics kinetic
+    energy or the charge of an RC circuit, sampled after every step, in chunks.
+
+    :param step: Callable that advances the simulation by one sampling interval.
+    :param observable: Callable returning the scalar to analyze.
+    """
+    chunk = np.empty(chunk_size)
+    for start in range(0, n_samples, chunk_size):
+        count = min(chunk_size, n_samples - start)
+        for i in range(count):
+            step()
+            chunk[i] = observable()
+        yield chunk[:count].copy()
+
+# ****************************************
+# Spectrogram Class
+# ****************************************
+class Spectrogram:
+    """
+    Streaming short-time Fourier transform. Samples are fed in chunks of any size;
+    every complete window of n samples, advanced by hop, becomes one spectrum. Frames
+    are windowed and transformed in batches with one real FFT call, and only the
+    samples of the current partial window are kept between chunks, so memory is
+    bounded by the spectrogram itself.
+    """
+    def __init__(self, delta, n, hop=None, window="hann", batch=256, capacity=64):
+        """
+        :param delta: The sampling interval.
+        :param n: Samples per window.
+        :param hop: Samples between window starts; n // 2 if None.
+        :param window: Window name or tuple understood by scipy.signal.get_window.
+        :param batch: Frames transformed per FFT call.
+        :param capacity: Initial number of frames in the output buffer; it doubles
+                         whenever it fills.
+        """
+        self.delta = delta
+        self.n = n
+        self.hop = n // 2 if hop is None else hop
+        self.window = scipy.signal.get_window(window, n)
+        self.batch = batch
+        self.frequencies = np.fft.rfftfreq(n, delta)
+        # (2 |X| / sum(w))^2 is the squared amplitude of a sinusoid; DC has no factor 2
+        self._scale = np.full(len(self.frequencies), (2.0 / self.window.sum())**2)
+        self._scale[0] /= 4
+        if n % 2 == 0:
+            self._scale[-1] /= 4
+        self._power = np.empty((capacity, len(self.frequencies)))
+        self._pending = np.empty(0)
+        self._skip = 0  # samples still to drop before the next window when hop > n
+        self.n_frames = 0
+        self.n_samples = 0
+
+    def feed(self, chunk):
+        """
+        Appends a chunk of samples and transforms every window it completes.
+
+        :param chunk: 1D array (or scalar) of new samples.
+        :return: The number of new frames.
+        """
+        chunk = np.atleast_1d(np.asarray(chunk, dtype=float))
+        self.n_samples += len(chunk)
+        skipped = min(self._skip, len(chunk))
+        self._skip -= skipped
+        samples = np.concatenate([self._pending, chunk[skipped:]])
+        if len(samples) < self.n:
+            self._pending = samples
+            return 0
+        frames = sliding_window_view(samples, self.n)[::self.hop]
+        for start in range(0, len(frames), self.batch):
+            spectra = scipy.fft.rfft(frames[start:start + self.batch] * self.window, axis=1, workers=-1)
+            self._append(self._scale * (spectra.real**2 + spectra.imag**2))
+        self._pending = samples[len(frames) * self.hop:].copy()
+        self._skip = max(len(frames) * self.hop - len(samples), 0)
+        return len(frames)
+
+    def consume(self, chunks):
+        """
+        Feeds every chunk of an iterable, e.g. one of the chunk generators above.
+
+        :return: self, for chaining.
+        """
+        for chunk in chunks:
+            self.feed(chunk)
+        return self
+
+    def _append(self, rows):
+        needed = self.n_frames + len(rows)
+        if needed > len(self._power):
+            grown = np.empty((max(needed, 2 * len(self._power)), self._power.shape[1]))
+            grown[:self.n_frames] = self._power[:self.n_frames]
+            self._power = grown
+        self._power[self.n_frames:needed] = rows
+        self.n_frames = needed
+
+    @property
+    def power(self):
+        """
+        The spectrogram so far, of shape (n_frames, n // 2 + 1); a view of the buffer.
+        """
+        return self._power[:self.n_frames]
+
+    @property
+    def times(self):
+        """
+        The time at the center of each frame.
+        """
+        return (np.arange(self.n_frames) * self.hop + self.n / 2) * self.delta
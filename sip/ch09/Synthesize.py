@@ -0,0 +1,102 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+
+# ****************************************
+# Basis Cache
+# ****************************************
+_basis_cache = OrderedDict()
+_BASIS_CACHE_SIZE = 8
+
+def harmonic_basis(x, period, K):
+    """
+    Returns the matrix [1, cos(kx), sin(kx), ..., cos(Kkx), sin(Kkx)] of shape
+    (len(x), 2K + 1), cached by (x-grid, period, K) with LRU eviction.
+    """
+    key = (hashlib.sha1(np.ascontiguousarray(x, dtype=float).tobytes()).hexdigest(), len(x), period, K)
+    if key in _basis_cache:
+        _basis_cache.move_to_end(key)
+        return _basis_cache[key]
+    phase = np.outer(x, 2 * np.pi / period * np.arange(1, K + 1))
+    basis = np.empty((len(x), 2 * K + 1))
+    basis[:, 0] = 1.0
+    basis[:, 1::2] = np.cos(phase)
+    basis[:, 2::2] = np.sin(phase)
+    basis.setflags(write=False)
+    _basis_cache[key] = basis
+    if len(_basis_cache) > _BASIS_CACHE_SIZE:
+        _basis_cache.popitem(last=False)
+    return basis
+
+# ****************************************
+# Synthesize Class
+# ****************************************
+class Synthesize:
+    """
+    Synthesizes f(x) = c_0 + sum_n [c_n cos(n k x) + s_n sin(n k x)], k = 2 pi / period.
+    """
+    def __init__(self, period, cos_coeffs, sin_coeffs):
+        """
+        :param period: The period of the fundamental.
+        :param cos_coeffs: Cosine coefficients c_0, c_1, ...
+        :param sin_coeffs: Sine coefficients s_0, s_1, ... (s_0 is ignored).
+        """
+        self.period = period
+        K = max(len(cos_coeffs), len(sin_coeffs)) - 1
+        self.K = max(K, 0)
+        self.cos_coeffs = np.zeros(self.K + 1)
+        self.sin_coeffs = np.zeros(self.K + 1)
+        self.cos_coeffs[:len(cos_coeffs)] = cos_coeffs
+        self.sin_coeffs[:len(sin_coeffs)] = sin_coeffs
+        self.sin_coeffs[0] = 0.0
+
+    def evaluate(self, x):
+        """
+        Evaluates the series on the grid x. On a uniform grid whose spacing divides the
+        period, one period is computed with an inverse real FFT and tiled; otherwise a
+        cached harmonic basis is applied with a single matrix-vector product.
+        """
+        x = np.asarray(x, dtype=float)
+        M = self._fft_length(x)
+        if M is not None:
+            k = 2 * np.pi / self.period
+            n = np.arange(self.K + 1)
+            spectrum = np.zeros(M // 2 + 1, dtype=complex)
+            spectrum[:self.K + 1] = 0.5 * M * (self.cos_coeffs - 1j * self.sin_coeffs) * np.exp(1j * n * k * x[0])
+            spectrum[0] = M * self.cos_coeffs[0]
+            one_period = np.fft.irfft(spectrum, M)
+            return one_period[np.arange(len(x)) % M]
+        return harmonic_basis(x, self.period, self.K) @ self._coefficient_vector()
+
+    def components(self, x):
+        """
+        Yields the n-th harmonic c_n cos(n k x) + s_n sin(n k x) for n = 0..K, built
+        lazily from the cached basis, for plotting individual components.
+        """
+        basis = harmonic_basis(np.asarray(x, dtype=float), self.period, self.K)
+        yield np.full(len(x), self.cos_coeffs[0])
+        for n in range(1, self.K + 1):
+            yield self.cos_coeffs[n] * basis[:, 2 * n - 1] + self.sin_coeffs[n] * basis[:, 2 * n]
+
+    def _coefficient_vector(self):
+        vector = np.empty(2 * self.K + 1)
+        vector[0] = self.cos_coeffs[0]
+        vector[1::2] = self.cos_coeffs[1:]
+        vector[2::2] = self.sin_coeffs[1:]
+        return vector
+
+    def _fft_length(self, x, rtol=1e-9):
+        """
+        Returns the number of grid points per period if x is uniform with a spacing that
+        divides the period and resolves every harmonic, else None.
+        """
+        if len(x) < 2:
+            return None
+        h = (x[-1] - x[0]) / (len(x) - 1)
+        if h <= 0 or not np.allclose(np.diff(x), h, rtol=1e-9, atol=0):
+            return None
+        ratio = self.period / h
+        M = int(round(ratio))
+        if abs(ratio - M) > rtol * ratio or M <= 2 * self.K or M > 4 * len(x):
+            return None
+        return M
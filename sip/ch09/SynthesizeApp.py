@@ -2,6 +2,7 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from Synthesize import Synthesize
 
 st.set_page_config(layout="wide")
 st.title("Fourier Synthesis App")
@@ -20,36 +21,6 @@ if 'sin_coeffs' not in st.session_state:
 if 'cos_coeffs' not in st.session_state:
     st.session_state.cos_coeffs = DEFAULT_COS_COEFFS.copy()
 
-# ****************************************
-# [Synthesis Function]
-# ****************************************
-def synthesize_function(x, period, cos_coeffs, sin_coeffs):
-    """Synthesizes a function from its Fourier coefficients."""
-    y = np.zeros_like(x)
-    components = []
-    
-    # Add the DC component (c_0)
-    if len(cos_coeffs) > 0:
-        y += cos_coeffs[0]
-        components.append(np.full_like(x, cos_coeffs[0]))
-
-    # Add the AC components (n > 0)
-    k = 2 * np.pi / period
-    max_len = max(len(cos_coeffs), len(sin_coeffs))
-    
-    for n in range(1, max_len):
-        cos_term = 0
-        sin_term = 0
-        if n < len(cos_coeffs):
-            cos_term = cos_coeffs[n] * np.cos(n * k * x)
-        if n < len(sin_coeffs):
-            sin_term = sin_coeffs[n] * np.sin(n * k * x)
-        
-        y += cos_term + sin_term
-        components.append(cos_term + sin_term)
-        
-    return y, components
-
 # ****************************************
 # [UI Controls]
 # ****************************************
@@ -58,6 +29,7 @@ xmin = st.sidebar.number_input("x min", -5.0, 5.0, -1.0, 0.1)
 xmax = st.sidebar.number_input("x max", -5.0, 5.0, 1.0, 0.1)
 N = st.sidebar.slider("Number of points (N)", 100, 1000, 300, 50)
 period = st.sidebar.number_input("Period", 0.1, 10.0, 1.0, 0.1)
+show_components = st.sidebar.checkbox("Show individual components", value=True)
 
 if st.sidebar.button("Reset Coefficients to Square Wave"):
     st.session_state.sin_coeffs = DEFAULT_SINE_COEFFS.copy()
@@ -76,7 +48,8 @@ x_vals = np.linspace(xmin, xmax, N)
 cos_c = st.session_state.cos_coeffs['Coefficient'].values
 sin_c = st.session_state.sin_coeffs['Coefficient'].values
 
-y_synthesized, y_components = synthesize_function(x_vals, period, cos_c, sin_c)
+synthesizer = Synthesize(period, cos_c, sin_c)
+y_synthesized = synthesizer.evaluate(x_vals)
 
 col1, col2 = st.columns(2)
 
@@ -90,14 +63,16 @@ with col1:
     ax1.grid(True)
     st.pyplot(fig1)
 
-with col2:
-    st.subheader("Individual Components")
-    fig2, ax2 = plt.subplots()
-    for i, component in enumerate(y_components):
-        ax2.plot(x_vals, component, label=f'n={i}')
-    ax2.set_xlabel("x")
-    ax2.set_ylabel("Component Value")
-    ax2.set_title("Function Components")
-    ax2.legend(loc='upper right')
-    ax2.grid(True)
-    st.pyplot(fig2)
+if show_components:
+    with col2:
+        st.subheader("Individual Components")
+        fig2, ax2 = plt.subplots()
+        # Components are only materialized when this plot is shown
+        for i, component in enumerate(synthesizer.components(x_vals)):
+            ax2.plot(x_vals, component, label=f'n={i}')
+        ax2.set_xlabel("x")
+        ax2.set_ylabel("Component Value")
+        ax2.set_title("Function Components")
+        ax2.legend(loc='upper right')
+        ax2.grid(True)
+        st.pyplot(fig2)
@@ -0,0 +1,39 @@
+import time
+import unittest
+from Expression import Expression, ExpressionError
+
+class ExpressionTest(unittest.TestCase):
+    def test_constant_power_tower_is_rejected_quickly(self):
+        start = time.perf_counter()
+        with self.assertRaises(ExpressionError):
+            Expression("9**9**9", ())()
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+    def test_small_integer_powers_still_evaluate(self):
+        self.assertEqual(Expression("2**10", ())(), 1024.0)
+        self.assertEqual(Expression("x**2", ("x",))(x=3.0), 9.0)
+
+    def test_attribute_access_is_rejected(self):
+        for source in ("x.real", "np.__dict__", "np.load", "np.sin.__call__(x)", "(1).__class__"):
+            with self.subTest(source=source), self.assertRaises(ExpressionError):
+                Expression(source, ("x",))
+
+    def test_dunder_and_builtin_names_are_rejected(self):
+        for source in ("__import__('os')", "__builtins__", "eval('1')", "open('f')"):
+            with self.subTest(source=source), self.assertRaises(ExpressionError):
+                Expression(source, ("x",))
+
+    def test_only_whitelisted_functions_can_be_called(self):
+        for source in ("x(1)", "pi()", "np.pi(x)", "sin(x)(x)"):
+            with self.subTest(source=source), self.assertRaises(ExpressionError):
+                Expression(source, ("x",))
+        self.assertEqual(Expression("np.sqrt(x) + abs(x)", ("x",))(x=4.0), 6.0)
+
+    def test_lambdas_and_comprehensions_are_rejected(self):
+        for source in ("lambda: 1", "(lambda y: y)(x)", "[i for i in x]", "sum(i for i in x)",
+                       "{i: i for i in x}", "(y := 2)", "'text'"):
+            with self.subTest(source=source), self.assertRaises(ExpressionError):
+                Expression(source, ("x",))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from OutOfCoreFFT import fft2_memmap
+
+class OutOfCoreFFTTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.grid = rng.standard_normal((24, 40)) + 1j * rng.standard_normal((24, 40))
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def transform(self, source, **options):
+        result = fft2_memmap(source, path=os.path.join(self.directory.name, "result.npy"),
+                             memory_budget=4096, threads=2, tile=8, **options)
+        self.addCleanup(lambda: result._mmap.close())
+        return np.array(result)
+
+    def test_matches_numpy_fft2(self):
+        np.testing.assert_allclose(self.transform(self.grid), np.fft.fft2(self.grid), atol=1e-10)
+        np.testing.assert_allclose(self.transform(self.grid, inverse=True), np.fft.ifft2(self.grid), atol=1e-12)
+
+    def test_array_input_is_unchanged(self):
+        source = self.grid.copy()
+        self.transform(source)
+        np.testing.assert_array_equal(source, self.grid)
+
+    def test_memmap_input_is_unchanged(self):
+        path = os.path.join(self.directory.name, "source.npy")
+        np.save(path, self.grid)
+        source = np.load(path, mmap_mode="r+")
+        self.transform(source)
+        source.flush()
+        del source
+        np.testing.assert_array_equal(np.load(path), self.grid)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+from collections import OrderedDict
+from functools import lru_cache
+import numpy as np
+import scipy.fft
+import scipy.linalg
+import LaplaceOperator
+from SparseLaplace import mask_hash
+
+# ****************************************
+# Fast Box Solver
+# ****************************************
+def dst_x(a):
+    """
+    Orthonormal type-I DST along x (axis 1); it is its own inverse.
+    """
+    return scipy.fft.dst(a, type=1, norm='ortho', axis=1, workers=-1)
+
+@lru_cache(maxsize=4)
+def pivots(ny, nx):
+    """
+    Cached, read-only pivots of the tridiagonal systems left after a sine transform
+    along x: for x mode k the y operator has 2 + mu_k on the diagonal and -1 beside it.
+    Gaussian elimination without pivoting gives pivot_i = 1 / (2 + mu_k - pivot_{i-1}).
+    """
+    mu = 2 - 2 * np.cos(np.pi * np.arange(1, nx + 1) / (nx + 1))
+    table = np.empty((ny, nx))
+    previous = np.zeros(nx)
+    for i in range(ny):
+        previous = table[i] = 1.0 / (2 + mu - previous)
+    table.setflags(write=False)
+    return table
+
+def tridiagonal_solve(b_hat, table):
+    """
+    Solves every x mode's tridiagonal system along y at once (Thomas algorithm
+    vectorized over modes), returning a new array.
+    """
+    y = b_hat * 1.0
+    y[0] *= table[0]
+    for i in range(1, len(y)):
+        y[i] += y[i - 1]
+        y[i] *= table[i]
+    for i in range(len(y) - 2, -1, -1):
+        y[i] += table[i] * y[i + 1]
+    return y
+
+def box_solve(b):
+    """
+    Solves (4 V - neighbor sum) = b on the interior of a box with grounded edges by
+    Fourier analysis along x and tridiagonal solves along y (FACR(0)), in O(n^2 log n).
+
+    :param b: Interior right-hand side of shape (ny-2, nx-2).
+    """
+    return dst_x(tridiagonal_solve(dst_x(b), pivots(*b.shape)))
+
+def _line_green(mu, i, j, n):
+    """
+    Inverse of the n x n tridiagonal matrix (2 + mu) on the diagonal and -1 beside it,
+    entries (i, j) for 1-based indices, written with decaying exponentials so that it
+    cannot overflow: sinh(t i<) sinh(t (n + 1 - i>)) / (sinh t sinh(t (n + 1))).
+    """
+    theta = np.arccosh(1 + mu / 2)
+    low, high = np.minimum(i, j), np.maximum(i, j)
+    return (np.exp(-theta * (high - low)) * -np.expm1(-2 * theta * low)
+            * -np.expm1(-2 * theta * (n + 1 - high))
+            / (2 * np.sinh(theta) * -np.expm1(-2 * theta * (n + 1))))
+
+# ****************************************
+# Capacitance-Matrix Cache
+# ****************************************
+_capacitance_cache = OrderedDict()
+_CAPACITANCE_CACHE_SIZE = 4
+
+def capacitance_system(is_conductor):
+    """
+    Returns (rows, columns, Cholesky factor) for the interior conductor nodes of a mask,
+    cached by mask hash with LRU eviction. The capacitance matrix is the box Green's
+    function G restricted to those nodes; it is built with a DST along x and the
+    closed-form tridiagonal inverse along y, one matrix product per pair of conductor
+    rows, instead of one fast solve per node.
+    """
+    key = mask_hash(is_conductor)
+    if key in _capacitance_cache:
+        _capacitance_cache.move_to_end(key)
+        return _capacitance_cache[key]
+    ny, nx = is_conductor.shape[0] - 2, is_conductor.shape[1] - 2
+    rows, columns = np.nonzero(is_conductor[1:-1, 1:-1])
+    if len(rows) == 0:
+        system = (rows, columns, None)
+    else:
+        k = np.arange(1, nx + 1)
+        mu = 2 - 2 * np.cos(np.pi * k / (nx + 1))
+        sine = np.sqrt(2 / (nx + 1)) * np.sin(np.pi * np.outer(columns + 1, k) / (nx + 1))
+        M = np.empty((len(rows), len(rows)))
+        groups = [np.flatnonzero(rows == row) for row in np.unique(rows)]
+        for g, a in enumerate(groups):
+            for b in groups[g:]:
+                weights = _line_green(mu, rows[a[0]] + 1, rows[b[0]] + 1, ny)
+                M[np.ix_(a, b)] = (sine[a] * weights) @ sine[b].T
+                M[np.ix_(b, a)] = M[np.ix_(a, b)].T
+        system = (rows, columns, scipy.linalg.cho_factor(M))
+    _capacitance_cache[key] = system
+    if len(_capacitance_cache) > _CAPACITANCE_CACHE_SIZE:
+        _capacitance_cache.popitem(last=False)
+    return system
+
+# ****************************************
+# DSTPoisson Class
+# ****************************************
+class DSTPoisson:
+    """
+    Direct Poisson solver for a rectangular box with interior conductors. The box is
+    solved with a sine transform along x and tridiagonal solves along y; conductors
+    inside it are enforced by a surface charge q on their nodes found from the
+    capacitance matrix (the Schur complement of the conductor nodes), which is
+    factorized once per geometry. Each solve costs two sine transforms, two sets of
+    tridiagonal solves, transforms of the conductor rows and a dense Cholesky solve.
+    Grids of 2^k + 1 points give power-of-two transforms.
+    """
+    def __init__(self, is_conductor):
+        """
+        :param is_conductor: Boolean conductor mask; the outer edges are always conductors.
+        """
+        self.is_conductor = LaplaceOperator.with_boundary(is_conductor)
+        self.rows, self.columns, self.factor = capacitance_system(self.is_conductor)
+        # the distinct conductor rows, and each conductor node's place among them
+        self.conductor_rows, self.row_position = np.unique(self.rows, return_inverse=True)
+
+    def solve(self, potential, rho=None):
+        """
+        Solves for the free-node potentials, in place.
+
+        :param potential: Array holding the conductor potentials, including the box edges.
+        :param rho: Charge density for -lap V = rho (one-cell spacing), or None.
+        :return: The potential.
+        """
+        # potentials on the box edges move to the right-hand side
+        edges = potential.copy()
+        edges[1:-1, 1:-1] = 0
+        b = LaplaceOperator.neighbor_sum(edges)[1:-1, 1:-1]
+        if rho is not None:
+            b += np.where(self.is_conductor, 0.0, rho)[1:-1, 1:-1]
+        table = pivots(*b.shape)
+        b_hat = dst_x(b)
+        u_hat = tridiagonal_solve(b_hat, table)
+        if self.factor is not None:
+            # charges that bring each interior conductor to its potential; only the
+            # conductor rows have to be transformed back to find them
+            at_conductors = dst_x(u_hat[self.conductor_rows])[self.row_position, self.columns]
+            target = potential[1:-1, 1:-1][self.rows, self.columns]
+            q = np.zeros((len(self.conductor_rows), b.shape[1]))
+            q[self.row_position, self.columns] = scipy.linalg.cho_solve(self.factor, target - at_conductors)
+            b_hat[self.conductor_rows] += dst_x(q)
+            u_hat = tridiagonal_solve(b_hat, table)
+        interior = dst_x(u_hat)
+        free = ~self.is_conductor[1:-1, 1:-1]
+        potential[1:-1, 1:-1][free] = interior[free]
+        return potential
@@ -0,0 +1 @@
+../ch09/Expression.py
\ No newline at end of file
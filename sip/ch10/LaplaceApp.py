@@ -1,7 +1,12 @@
 import streamlit as st
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 import time
+import LaplaceOperator
+from Multigrid import Multigrid
+from SparseLaplace import DirectSolver, label_conductors
+from DSTPoisson import DSTPoisson
 
 st.set_page_config(layout="wide")
 st.title("Solving Laplace's Equation with Relaxation Method")
@@ -9,7 +14,7 @@ st.title("Solving Laplace's Equation with Relaxation Method")
 # ****************************************
 # [Session State Initialization]
 # ****************************************
-def initialize_state(grid_size, geometry):
+def initialize_state(grid_size, geometry, voltages=(100, -100)):
     """Initializes the potential and conductor arrays based on geometry."""
     potential = np.zeros((grid_size, grid_size))
     is_conductor = np.zeros((grid_size, grid_size), dtype=bool)
@@ -20,29 +25,45 @@ def initialize_state(grid_size, geometry):
     is_conductor[:, 0] = True
     is_conductor[:, -1] = True
 
+    plates = []
     if geometry == "Parallel Plates":
         plate1_pos = grid_size // 3
         plate2_pos = 2 * grid_size // 3
-        is_conductor[plate1_pos, 5:-5] = True
-        potential[plate1_pos, 5:-5] = 100
-        is_conductor[plate2_pos, 5:-5] = True
-        potential[plate2_pos, 5:-5] = -100
+        for position, voltage in zip((plate1_pos, plate2_pos), voltages):
+            plate = np.zeros((grid_size, grid_size), dtype=bool)
+            plate[position, 5:-5] = True
+            is_conductor[plate] = True
+            potential[plate] = voltage
+            plates.append(plate)
     
+    st.session_state.plates = plates
     st.session_state.potential = potential
     st.session_state.is_conductor = is_conductor
     st.session_state.iteration = 0
     st.session_state.error = np.inf
+    st.session_state.residual_history = []
 
 # ****************************************
 # [UI Controls]
 # ****************************************
 st.sidebar.header("Controls")
-grid_size = st.sidebar.select_slider("Grid Size", options=[31, 63, 127], value=31)
+grid_size = st.sidebar.select_slider("Grid Size", options=[31, 63, 127, 129, 257, 513, 1025], value=31)
 max_error = st.sidebar.number_input("Maximum Error Tolerance", 0.01, 10.0, 0.1, 0.01)
 geometry = st.sidebar.selectbox("Conductor Geometry", ["Parallel Plates"])
+# Multigrid coarsens fully on 2^k + 1 grids; its error is the largest residual
+# The direct solvers precompute once per geometry; voltage changes then re-solve instantly
+solver = st.sidebar.selectbox("Solver", ["Jacobi Relaxation", "Multigrid", "Sparse Direct", "DST + Capacitance Matrix"])
+direct_solvers = {"Sparse Direct": DirectSolver, "DST + Capacitance Matrix": DSTPoisson}
+cycle_type = st.sidebar.selectbox("Multigrid Cycle", ["V", "W", "F"], disabled=solver != "Multigrid")
+if solver == "Multigrid":
+    st.sidebar.caption("Each cycle preconditions a conjugate-gradient step, which cuts the residual "
+                       "about 5x per cycle. Plain cycles only reach about 2x here, because the coarse "
+                       "grids thicken the plates.")
+voltage1 = st.sidebar.number_input("Plate 1 Voltage", -1000.0, 1000.0, 100.0, 10.0)
+voltage2 = st.sidebar.number_input("Plate 2 Voltage", -1000.0, 1000.0, -100.0, 10.0)
 
 if 'potential' not in st.session_state or st.sidebar.button("Initialize/Reset"):
-    initialize_state(grid_size, geometry)
+    initialize_state(grid_size, geometry, (voltage1, voltage2))
     st.session_state.running = False
 
 if st.sidebar.button("Start/Stop"):
@@ -96,8 +117,9 @@ def draw_plots():
     # Calculate and Plot E-Field
     ey, ex = np.gradient(-potential)
     fig2, ax2 = plt.subplots()
-    skip = 2 # Plot fewer vectors for clarity
-    ax2.quiver(np.arange(0, grid_size, skip), np.arange(0, grid_size, skip),
+    n = potential.shape[0]
+    skip = max(2, n // 64) # Plot fewer vectors for clarity
+    ax2.quiver(np.arange(0, n, skip), np.arange(0, n, skip),
                ex[::skip, ::skip], ey[::skip, ::skip],
                color='r', pivot='middle')
     ax2.set_title("Electric Field")
@@ -108,7 +130,34 @@ def draw_plots():
     plt.close(fig2)
 
 # Animation loop
-if st.session_state.running:
+if solver in direct_solvers:
+    # Apply the current plate voltages and solve with the cached factorization
+    direct = direct_solvers[solver](st.session_state.is_conductor)
+    for plate, voltage in zip(st.session_state.plates, (voltage1, voltage2)):
+        st.session_state.potential[plate] = voltage
+    direct.solve(st.session_state.potential)
+    st.session_state.iteration = 1
+    st.session_state.error = np.max(np.abs(LaplaceOperator.residual(
+        st.session_state.potential, None, direct.is_conductor)))
+    st.session_state.running = False
+elif st.session_state.running and solver == "Multigrid":
+    multigrid = Multigrid(st.session_state.is_conductor)
+    for error in multigrid.cycles(st.session_state.potential, kind=cycle_type):
+        st.session_state.iteration += 1
+        st.session_state.error = error
+        st.session_state.residual_history.append(error)
+        draw_plots()
+        info_placeholder.text(f"Cycle: {st.session_state.iteration}, Max Residual: {error:.4g}")
+        if error <= max_error:
+            break
+
+    st.session_state.running = False
+    if st.session_state.error <= max_error:
+        st.success(f"Converged after {st.session_state.iteration} multigrid cycles!")
+    else:
+        st.warning(f"Stopped after {st.session_state.iteration} multigrid cycles without reaching "
+                   f"the tolerance; max residual {st.session_state.error:.4g}.")
+elif st.session_state.running:
     while st.session_state.error > max_error:
         st.session_state.potential, st.session_state.error = relaxation_step(
             st.session_state.potential, st.session_state.is_conductor
@@ -127,3 +176,20 @@ if st.session_state.running:
 # Draw final state or initial state
 draw_plots()
 info_placeholder.text(f"Iteration: {st.session_state.iteration}, Max Error: {st.session_state.error:.4f}")
+
+if st.session_state.residual_history:
+    st.subheader("Residual History")
+    fig3, ax3 = plt.subplots()
+    ax3.semilogy(np.arange(1, len(st.session_state.residual_history) + 1), st.session_state.residual_history, 'o-')
+    ax3.set_xlabel("Cycle")
+    ax3.set_ylabel("Max Residual")
+    ax3.grid(True)
+    st.pyplot(fig3)
+    plt.close(fig3)
+
+if solver == "Sparse Direct":
+    # Every conductor (the grounded box first) from the same factorization
+    conductors = label_conductors(direct.is_conductor)
+    names = ["Box"] + [f"Plate {i}" for i in range(1, len(conductors))]
+    st.subheader("Capacitance Matrix (charge per unit potential, epsilon_0 = 1)")
+    st.dataframe(pd.DataFrame(direct.capacitance_matrix(conductors), index=names, columns=names))
@@ -0,0 +1,72 @@
+import numpy as np
+import scipy.sparse
+
+# ****************************************
+# Five-Point Discretization
+# ****************************************
+# The grid spacing is one cell. Free nodes satisfy 4 V - (sum of the four neighbors) = b,
+# where b = rho * h^2 for -lap V = rho (b = 0 for Laplace's equation); conductor nodes
+# hold fixed potentials. The outermost rows and columns must be conductors.
+
+def with_boundary(is_conductor):
+    """
+    Returns a copy of the conductor mask with the outer edges marked as conductors.
+    """
+    mask = np.array(is_conductor, dtype=bool)
+    mask[0, :] = mask[-1, :] = True
+    mask[:, 0] = mask[:, -1] = True
+    return mask
+
+def neighbor_sum(u, out=None):
+    """
+    Sum of the four neighbors at every interior node; the edges of out are zero.
+    """
+    if out is None:
+        out = np.zeros_like(u)
+    out[1:-1, 1:-1] = u[:-2, 1:-1] + u[2:, 1:-1] + u[1:-1, :-2] + u[1:-1, 2:]
+    return out
+
+def residual(u, b, is_conductor, out=None):
+    """
+    Returns b - (4 V - neighbor sum) on free nodes and zero on conductors.
+
+    :param b: Right-hand side array, or None for Laplace's equation.
+    """
+    out = neighbor_sum(u, out)
+    out[1:-1, 1:-1] -= 4 * u[1:-1, 1:-1]
+    if b is not None:
+        out[1:-1, 1:-1] += b[1:-1, 1:-1]
+    out[is_conductor] = 0
+    return out
+
+def matrix(is_conductor):
+    """
+    Assembles the five-point operator restricted to the free nodes.
+
+    :return: Tuple (A, free) of the sparse CSC matrix, of size (number of free nodes)^2,
+             and the flat indices of the free nodes in row-major order.
+    """
+    free_mask = ~is_conductor
+    free = np.flatnonzero(free_mask)
+    number = np.full(is_conductor.size, -1)
+    number[free] = np.arange(len(free))
+    number = number.reshape(is_conductor.shape)
+
+    rows, columns = [np.arange(len(free))], [np.arange(len(free))]
+    values = [np.full(len(free), 4.0)]
+    for shift in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        neighbor = np.roll(number, shift, axis=(0, 1))
+        both = free_mask & (neighbor >= 0)
+        rows.append(number[both])
+        columns.append(neighbor[both])
+        values.append(np.full(both.sum(), -1.0))
+    A = scipy.sparse.csc_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(columns))),
+                                shape=(len(free), len(free)))
+    return A, free
+
+def boundary_terms(u, is_conductor):
+    """
+    Returns, for every free node, the sum of the potentials of its conductor neighbors,
+    which moves to the right-hand side of A V_free = b_free + boundary_terms.
+    """
+    return neighbor_sum(np.where(is_conductor, u, 0.0))[~is_conductor]
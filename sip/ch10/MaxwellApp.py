@@ -2,6 +2,7 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import time
+from YeeFDTD import YeeFDTD
 
 st.set_page_config(layout="centered")
 st.title("3D Maxwell's Equations Solver (FDTD)")
@@ -9,41 +10,17 @@ st.title("3D Maxwell's Equations Solver (FDTD)")
 # ****************************************
 # [Maxwell FDTD Simulation Class]
 # ****************************************
-class Maxwell:
-    def __init__(self, size):
-        self.size = size
+class Maxwell(YeeFDTD):
+    def __init__(self, size, single=False):
+        # E and B fields (Ex, Ey, Ez, Bx, By, Bz) with c=1, dx=1, dy=1, dz=1
+        super().__init__(size, dt=0.5, single=single) # dt should satisfy CFL condition dt <= 1/sqrt(3) for 3D
         self.t = 0
         
-        # E and B fields (Ex, Ey, Ez, Bx, By, Bz)
-        self.E = np.zeros((3, size, size, size))
-        self.B = np.zeros((3, size, size, size))
-        
-        # FDTD parameters (assuming c=1, dx=1, dy=1, dz=1)
-        self.dt = 0.5 # Should satisfy CFL condition dt <= 1/sqrt(3) for 3D
-        
         # Source parameters
         self.source_pos = (size // 2, size // 2, size // 2)
         self.source_t0 = 20.0
         self.source_width = 5.0
 
-    def update_b_field(self):
-        curl_E_x = (self.E[2, :, 1:, :] - self.E[2, :, :-1, :]) - (self.E[1, :, :, 1:] - self.E[1, :, :, :-1])
-        curl_E_y = (self.E[0, :, :, 1:] - self.E[0, :, :, :-1]) - (self.E[2, 1:, :, :] - self.E[2, :-1, :, :])
-        curl_E_z = (self.E[1, 1:, :, :] - self.E[1, :-1, :, :]) - (self.E[0, :, 1:, :] - self.E[0, :, :-1, :])
-        
-        self.B[0, :, :-1, :-1] -= self.dt * curl_E_x
-        self.B[1, :-1, :, :-1] -= self.dt * curl_E_y
-        self.B[2, :-1, :-1, :] -= self.dt * curl_E_z
-
-    def update_e_field(self):
-        curl_B_x = (self.B[2, :, 1:, :] - self.B[2, :, :-1, :]) - (self.B[1, :, :, 1:] - self.B[1, :, :, :-1])
-        curl_B_y = (self.B[0, :, :, 1:] - self.B[0, :, :, :-1]) - (self.B[2, 1:, :, :] - self.B[2, :-1, :, :])
-        curl_B_z = (self.B[1, 1:, :, :] - self.B[1, :-1, :, :]) - (self.B[0, :, 1:, :] - self.B[0, :, :-1, :])
-
-        self.E[0, :, 1:, 1:] += self.dt * curl_B_x
-        self.E[1, 1:, :, 1:] += self.dt * curl_B_y
-        self.E[2, 1:, 1:, :] += self.dt * curl_B_z
-
     def add_source(self):
         # Add a Gaussian pulse source to Ez at the center
         pulse = np.exp(-((self.t - self.source_t0) / self.source_width)**2)
@@ -70,11 +47,12 @@ class Maxwell:
 # [UI Controls]
 # ****************************************
 st.sidebar.header("Simulation Parameters")
-size = st.sidebar.select_slider("Grid Size", options=[15, 31, 63], value=31)
+size = st.sidebar.select_slider("Grid Size", options=[15, 31, 63, 127], value=31)
 dt_param = st.sidebar.slider("Time Step (dt)", 0.1, 0.5, 0.5, 0.1)
+single = st.sidebar.checkbox("Single precision (float32)", value=False)
 
 if 'maxwell' not in st.session_state or st.sidebar.button("Initialize/Reset"):
-    st.session_state.maxwell = Maxwell(size)
+    st.session_state.maxwell = Maxwell(size, single)
     st.session_state.maxwell.dt = dt_param
     st.session_state.running = False
 
@@ -0,0 +1,206 @@
+import numpy as np
+import scipy.sparse.linalg
+import LaplaceOperator
+
+# ****************************************
+# Grid Transfers
+# ****************************************
+def _smooth_rows(r):
+    out = r.copy()
+    out[1:-1] = 0.25 * r[:-2] + 0.5 * r[1:-1] + 0.25 * r[2:]
+    return out
+
+def restrict(r):
+    """
+    Full-weighting restriction of a fine residual onto every second node.
+    """
+    return _smooth_rows(_smooth_rows(r).T).T[::2, ::2]
+
+def prolong(e, shape):
+    """
+    Bilinear interpolation of a coarse correction onto the fine grid of shape.
+    """
+    fine = np.zeros(shape)
+    fine[::2, ::2] = e
+    fine[1::2, ::2] = 0.5 * (e[:-1] + e[1:])
+    fine[:, 1::2] = 0.5 * (fine[:, :-2:2] + fine[:, 2::2])
+    return fine
+
+def coarsen_mask(is_conductor):
+    """
+    A coarse node is a conductor if any fine node of its restriction stencil is, so the
+    coarse-grid correction never reaches across or into a conductor.
+    """
+    grown = is_conductor.copy()
+    grown[1:] |= is_conductor[:-1]
+    grown[:-1] |= is_conductor[1:]
+    wide = grown.copy()
+    wide[:, 1:] |= grown[:, :-1]
+    wide[:, :-1] |= grown[:, 1:]
+    return wide[::2, ::2]
+
+# ****************************************
+# Multigrid Class
+# ****************************************
+class Multigrid:
+    """
+    Geometric multigrid for the five-point Laplace/Poisson problem with conductors.
+    Levels halve the grid while (n - 1) is even in both directions; each level smooths
+    with red-black Gauss-Seidel and the coarsest level is solved directly.
+
+    Coarse grids mark every node next to a conductor as a conductor, which keeps thin
+    plates from vanishing (injection alone loses plates off the coarse grid lines and
+    diverges) but slows plain cycling near them to a residual reduction of only about
+    0.5-0.6 per cycle. The cycles are therefore symmetric (the post-smoother reverses
+    the colors) and by default precondition conjugate gradients, which reduces the
+    residual about 0.15-0.2 per cycle, a 1e-6 tolerance in 11-13 cycles.
+    """
+    def __init__(self, is_conductor, pre=2, post=2, coarsest=17):
+        """
+        :param is_conductor: Boolean conductor mask; the outer edges are always conductors.
+        :param pre: Gauss-Seidel sweeps before each coarse-grid correction.
+        :param post: Gauss-Seidel sweeps after each coarse-grid correction.
+        :param coarsest: Stop coarsening once a grid dimension falls below this size.
+        """
+        self.pre = pre
+        self.post = post
+        self.masks = [LaplaceOperator.with_boundary(is_conductor)]
+        while all((n - 1) % 2 == 0 and (n - 1) // 2 + 1 >= coarsest for n in self.masks[-1].shape):
+            self.masks.append(LaplaceOperator.with_boundary(coarsen_mask(self.masks[-1])))
+        # per level, the red and black sub-lattices as strided slices plus their free masks
+        self.colors = [self._colors(mask) for mask in self.masks]
+        A, self.coarse_free = LaplaceOperator.matrix(self.masks[-1])
+        self.coarse_solver = scipy.sparse.linalg.splu(A)
+        self.residual_history = []
+
+    # ****************************************
+    # Cycle Components
+    # ****************************************
+    @staticmethod
+    def _colors(mask):
+        """
+        Splits the interior nodes into red (i + j even) and black sub-lattices, each the
+        union of two strided sub-grids, so a sweep touches only the nodes it updates.
+        """
+        ny, nx = mask.shape
+        colors = []
+        for starts in (((1, 1), (2, 2)), ((1, 2), (2, 1))):
+            color = []
+            for i0, j0 in starts:
+                rows, columns = len(range(i0, ny - 1, 2)), len(range(j0, nx - 1, 2))
+                if rows == 0 or columns == 0:
+                    continue
+                at = lambda di, dj: (slice(i0 + di, i0 + di + 2 * rows - 1, 2),
+                                     slice(j0 + dj, j0 + dj + 2 * columns - 1, 2))
+                neighbors = [at(-1, 0), at(1, 0), at(0, -1), at(0, 1)]
+                color.append((at(0, 0), neighbors, ~mask[at(0, 0)]))
+            colors.append(color)
+        return colors
+
+    def smooth(self, level, u, b, sweeps, reverse=False):
+        """
+        Red-black Gauss-Seidel sweeps on the free nodes of one level, in place; black
+        first if reverse, which makes a pre/post-smoothing pair symmetric.
+        """
+        colors = self.colors[level][::-1] if reverse else self.colors[level]
+        for _ in range(sweeps):
+            for color in colors:
+                for center, neighbors, free in color:
+                    total = u[neighbors[0]] + u[neighbors[1]]
+                    total += u[neighbors[2]]
+                    total += u[neighbors[3]]
+                    if b is not None:
+                        total += b[center]
+                    total *= 0.25
+                    np.copyto(u[center], total, where=free)
+
+    def direct(self, u, b):
+        """
+        Solves the coarsest level exactly, in place.
+        """
+        mask = self.masks[-1]
+        rhs = LaplaceOperator.boundary_terms(u, mask)
+        if b is not None:
+            rhs += b[~mask]
+        u.flat[self.coarse_free] = self.coarse_solver.solve(rhs)
+
+    def cycle(self, u, b=None, kind="V", level=0):
+        """
+        Applies one V-, W- or F-cycle to u in place.
+
+        :param u: Potential of the level, with conductor values set.
+        :param b: Right-hand side of the level, or None.
+        :param kind: "V", "W" or "F".
+        """
+        if level == len(self.masks) - 1:
+            self.direct(u, b)
+            return
+        self.smooth(level, u, b, self.pre)
+        r = LaplaceOperator.residual(u, b, self.masks[level])
+        # (4 e - sum) / (2h)^2 = R r / h^2 on the coarse grid
+        b_coarse = 4 * restrict(r)
+        b_coarse[self.masks[level + 1]] = 0
+        e = np.zeros_like(b_coarse)
+        if kind == "V":
+            self.cycle(e, b_coarse, "V", level + 1)
+        elif kind == "W":
+            self.cycle(e, b_coarse, "W", level + 1)
+            self.cycle(e, b_coarse, "W", level + 1)
+        elif kind == "F":
+            self.cycle(e, b_coarse, "F", level + 1)
+            self.cycle(e, b_coarse, "V", level + 1)
+        else:
+            raise ValueError(f"Unknown cycle '{kind}'; use 'V', 'W' or 'F'.")
+        correction = prolong(e, u.shape)
+        correction[self.masks[level]] = 0
+        u += correction
+        self.smooth(level, u, b, self.post, reverse=True)
+
+    # ****************************************
+    # Solvers
+    # ****************************************
+    def cycles(self, potential, rho=None, kind="V", max_cycles=50, krylov=True):
+        """
+        Yields the largest residual after each cycle, updating potential in place, so
+        callers can report progress and stop early. The history is kept in
+        residual_history.
+
+        :param potential: Initial guess holding the conductor potentials.
+        :param rho: Charge density for -lap V = rho (one-cell spacing), or None.
+        :param kind: "V", "W" or "F".
+        :param krylov: If True, each cycle preconditions a conjugate-gradient step;
+                       otherwise the cycles are applied directly.
+        """
+        mask = self.masks[0]
+        self.residual_history = []
+        r = LaplaceOperator.residual(potential, rho, mask)
+        if not krylov:
+            for _ in range(max_cycles):
+                self.cycle(potential, rho, kind)
+                LaplaceOperator.residual(potential, rho, mask, out=r)
+                self.residual_history.append(np.max(np.abs(r)))
+                yield self.residual_history[-1]
+            return
+        direction, rz = None, None
+        for _ in range(max_cycles):
+            z = np.zeros_like(potential)
+            self.cycle(z, r, kind)
+            rz_new = np.vdot(r, z)
+            direction = z if direction is None else z + (rz_new / rz) * direction
+            rz = rz_new
+            # A p = -(residual of p with zero right-hand side)
+            A_direction = -LaplaceOperator.residual(direction, None, mask)
+            alpha = rz / np.vdot(direction, A_direction)
+            potential += alpha * direction
+            r -= alpha * A_direction
+            self.residual_history.append(np.max(np.abs(r)))
+            yield self.residual_history[-1]
+
+    def solve(self, potential, rho=None, kind="V", tol=1e-8, max_cycles=50, krylov=True):
+        """
+        Cycles until the largest residual is below tol and returns the potential.
+        """
+        for error in self.cycles(potential, rho, kind, max_cycles, krylov):
+            if error < tol:
+                break
+        return potential
@@ -0,0 +1,106 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+import scipy.ndimage
+import scipy.sparse.linalg
+import LaplaceOperator
+
+# ****************************************
+# Factorization Cache
+# ****************************************
+_factor_cache = OrderedDict()
+_FACTOR_CACHE_SIZE = 4
+
+def mask_hash(is_conductor):
+    """
+    Returns a key identifying a conductor geometry.
+    """
+    mask = np.ascontiguousarray(is_conductor, dtype=bool)
+    return hashlib.sha1(mask.tobytes()).hexdigest(), mask.shape
+
+def factorize(is_conductor):
+    """
+    Returns (LU factorization, free node indices) of the five-point operator on the
+    free nodes, cached by mask hash with LRU eviction.
+    """
+    key = mask_hash(is_conductor)
+    if key in _factor_cache:
+        _factor_cache.move_to_end(key)
+        return _factor_cache[key]
+    A, free = LaplaceOperator.matrix(is_conductor)
+    _factor_cache[key] = (scipy.sparse.linalg.splu(A), free)
+    if len(_factor_cache) > _FACTOR_CACHE_SIZE:
+        _factor_cache.popitem(last=False)
+    return _factor_cache[key]
+
+def label_conductors(is_conductor):
+    """
+    Splits a conductor mask into its connected pieces (4-connectivity).
+
+    :return: List of boolean masks, one per conductor, ordered by first node.
+    """
+    labels, count = scipy.ndimage.label(is_conductor)
+    return [labels == k for k in range(1, count + 1)]
+
+# ****************************************
+# DirectSolver Class
+# ****************************************
+class DirectSolver:
+    """
+    Sparse direct solver for the five-point Laplace/Poisson problem. The operator on the
+    free nodes is factorized once per conductor geometry, so new conductor voltages or
+    charge densities cost one right-hand-side build and a back-substitution.
+    """
+    def __init__(self, is_conductor):
+        """
+        :param is_conductor: Boolean conductor mask; the outer edges are always conductors.
+        """
+        self.is_conductor = LaplaceOperator.with_boundary(is_conductor)
+        self.lu, self.free = factorize(self.is_conductor)
+
+    def solve(self, potential, rho=None):
+        """
+        Solves for the free-node potentials, in place.
+
+        :param potential: Array holding the conductor potentials; free values are ignored.
+        :param rho: Charge density for -lap V = rho (one-cell spacing), or None.
+        :return: The potential.
+        """
+        rhs = LaplaceOperator.boundary_terms(potential, self.is_conductor)
+        if rho is not None:
+            rhs += rho[~self.is_conductor]
+        potential.flat[self.free] = self.lu.solve(rhs)
+        return potential
+
+    def charges(self, potential, conductors):
+        """
+        Returns the charge on each conductor from Gauss's law: the flux V_c - V_f summed
+        over every edge from one of its nodes c to a free node f, in units with
+        epsilon_0 = 1 and one-cell spacing.
+
+        :param conductors: List of boolean masks, e.g. from label_conductors.
+        """
+        free = np.pad(~self.is_conductor, 1).astype(float)
+        free_neighbors = LaplaceOperator.neighbor_sum(free)[1:-1, 1:-1]
+        free_potentials = LaplaceOperator.neighbor_sum(np.pad(potential, 1) * free)[1:-1, 1:-1]
+        flux = free_neighbors * potential - free_potentials
+        return np.array([flux[mask].sum() for mask in conductors])
+
+    def capacitance_matrix(self, conductors):
+        """
+        Returns C with C[i, j] the charge on conductor j when conductor i is at unit
+        potential and all others, including any conductor not listed, are grounded.
+        All len(conductors) right-hand sides share the cached factorization.
+
+        :param conductors: List of boolean masks, e.g. from label_conductors.
+        """
+        potentials = np.zeros((len(conductors),) + self.is_conductor.shape)
+        for i, mask in enumerate(conductors):
+            potentials[i][mask] = 1.0
+        rhs = np.stack([LaplaceOperator.boundary_terms(v, self.is_conductor) for v in potentials], axis=1)
+        solutions = self.lu.solve(rhs)
+        C = np.empty((len(conductors), len(conductors)))
+        for i, v in enumerate(potentials):
+            v.flat[self.free] = solutions[:, i]
+            C[i] = self.charges(v, conductors)
+        return C
@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+from Expression import evaluate_grid
 
 st.set_page_config(layout="centered")
 st.title("2D Vector Field Plotter")
@@ -27,28 +28,14 @@ x_vals = np.linspace(xmin, xmax, nx)
 y_vals = np.linspace(ymin, ymax, ny)
 x, y = np.meshgrid(x_vals, y_vals)
 
-# Avoid division by zero at the origin
-r_squared = x**2 + y**2
-r_squared[r_squared == 0] = 1e-9
+grid = (("x", xmin, xmax, nx, True), ("y", ymin, ymax, ny, True))
+# Add r_squared to the context for convenience, avoiding division by zero at the origin
+derived = (("r_squared", "where(x**2 + y**2 == 0, 1e-9, x**2 + y**2)"),)
 
 try:
-    # Safe evaluation of the user-provided function strings
-    safe_dict = {
-        'x': x,
-        'y': y,
-        'np': np,
-        'sin': np.sin,
-        'cos': np.cos,
-        'tan': np.tan,
-        'exp': np.exp,
-        'sqrt': np.sqrt,
-        'pi': np.pi
-    }
-    # Add r_squared to the context for convenience
-    safe_dict['r_squared'] = r_squared
-    
-    fx = eval(fx_str, {"__builtins__": {}}, safe_dict)
-    fy = eval(fy_str, {"__builtins__": {}}, safe_dict)
+    # Whitelisted formulas, compiled once and cached per (formula, grid)
+    fx = evaluate_grid(fx_str, grid, derived)
+    fy = evaluate_grid(fy_str, grid, derived)
 except Exception as e:
     st.error(f"Error evaluating function: {e}")
     st.stop()